@@ -5,10 +5,50 @@ import os
 import sys
 import subprocess
 import shutil
+import glob
+import json
+import importlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 
 
+# Директории, которые не обходятся при поиске __pycache__
+PRUNED_DIRS = {".git", "venv", ".venv", "dist", "build", "node_modules"}
+
+# Модули, которые не используются приложением и не включаются в сборку
+EXCLUDED_MODULES = ("tkinter", "test", "unittest", "pydoc_data", "lib2to3", "distutils")
+
+# Файл с результатом последней успешной проверки зависимостей.
+# Хранится вне build/, так как эта директория удаляется при каждой сборке
+DEPCHECK_CACHE = ".depcheck.json"
+
+# Количество последних строк вывода PyInstaller, показываемых при ошибке
+OUTPUT_TAIL_LINES = 200
+
+# Количество потоков для параллельного удаления артефактов
+CLEANUP_WORKERS = 4
+
+
+def remove_spec_file(spec_file):
+    """Удаление файла спецификации PyInstaller"""
+    try:
+        print(f"Удаление файла спецификации {spec_file}...")
+        spec_file.unlink(missing_ok=True)
+    except Exception as e:
+        print(f"Предупреждение: Не удалось удалить {spec_file}: {e}")
+
+
+def remove_pycache_dir(pycache_dir):
+    """Удаление директории кэша Python"""
+    try:
+        print(f"Удаление кэша Python {pycache_dir}...")
+        shutil.rmtree(pycache_dir, ignore_errors=True)
+    except Exception as e:
+        print(f"Предупреждение: Не удалось удалить {pycache_dir}: {e}")
+
+
 def clean_build_artifacts():
     """Очистка артефактов предыдущих сборок"""
     print("Очистка артефактов предыдущих сборок...")
@@ -37,31 +77,61 @@ def clean_build_artifacts():
             except Exception as e:
                 print(f"Предупреждение: Не удалось полностью удалить {dir_name}: {e}")
     
-    # Удаление .spec файлов
-    spec_files = list(Path(".").glob("*.spec"))
-    for spec_file in spec_files:
-        try:
-            print(f"Удаление файла спецификации {spec_file}...")
-            spec_file.unlink(missing_ok=True)
-        except Exception as e:
-            print(f"Предупреждение: Не удалось удалить {spec_file}: {e}")
-    
-    # Удаление __pycache__ директорий
-    pycache_dirs = list(Path(".").rglob("__pycache__"))
-    for pycache_dir in pycache_dirs:
-        try:
-            print(f"Удаление кэша Python {pycache_dir}...")
-            shutil.rmtree(pycache_dir, ignore_errors=True)
-        except Exception as e:
-            print(f"Предупреждение: Не удалось удалить {pycache_dir}: {e}")
+    # Удаление .spec файлов и __pycache__ директорий выполняется параллельно
+    with ThreadPoolExecutor(max_workers=CLEANUP_WORKERS) as executor:
+        # Генератор glob не материализует список файлов заранее
+        executor.map(remove_spec_file, Path(".").glob("*.spec"))
+        
+        # Удаление __pycache__ директорий (без обхода виртуальных окружений, .git и т.п.)
+        for root, dirs, _ in os.walk(".", topdown=True):
+            if "__pycache__" in dirs:
+                executor.submit(remove_pycache_dir, os.path.join(root, "__pycache__"))
+                dirs.remove("__pycache__")
+            # Не спускаемся в директории, где нет исходного кода проекта
+            dirs[:] = [d for d in dirs if d not in PRUNED_DIRS]
     
     print("Очистка завершена.")
 
 
+def check_imports(packages_to_modules):
+    """Импортирует модули пакетов и возвращает список отсутствующих пакетов"""
+    missing_packages = []
+    
+    # Импортируем пакеты параллельно: загрузка тяжелых библиотек (PySide6, yt_dlp)
+    # в основном состоит из чтения файлов и dlopen, которые отпускают GIL
+    with ThreadPoolExecutor(max_workers=len(packages_to_modules)) as executor:
+        futures = {
+            executor.submit(importlib.import_module, module): package
+            for package, module in packages_to_modules.items()
+        }
+        for future in as_completed(futures):
+            package = futures[future]
+            try:
+                future.result()
+                print(f"✓ {package} установлен")
+            except ImportError:
+                missing_packages.append(package)
+                print(f"✗ {package} не найден")
+    
+    return missing_packages
+
+
 def check_dependencies():
     """Проверка наличия необходимых зависимостей"""
     print("Проверка зависимостей...")
     
+    # Если requirements.txt не менялся с последней успешной проверки, пропускаем импорты
+    requirements_mtime = os.stat("requirements.txt").st_mtime if os.path.exists("requirements.txt") else None
+    try:
+        with open(DEPCHECK_CACHE, "r", encoding="utf-8") as f:
+            cache = json.load(f)
+        if (cache.get("ok") and cache.get("mtime") == requirements_mtime
+                and cache.get("python") == sys.executable):
+            print("Зависимости не изменились с последней проверки.")
+            return True
+    except (OSError, ValueError):
+        pass
+    
     # Словарь соответствия имен пакетов и модулей
     packages_to_modules = {
         "pyinstaller": "PyInstaller",
@@ -71,15 +141,13 @@ def check_dependencies():
         "pillow": "PIL"
     }
     
-    missing_packages = []
-    
-    for package, module in packages_to_modules.items():
-        try:
-            __import__(module)
-            print(f"✓ {package} установлен")
-        except ImportError:
-            missing_packages.append(package)
-            print(f"✗ {package} не найден")
+    # Проверочные импорты не должны оставлять __pycache__ в каталогах пакетов
+    dont_write_bytecode = sys.dont_write_bytecode
+    sys.dont_write_bytecode = True
+    try:
+        missing_packages = check_imports(packages_to_modules)
+    finally:
+        sys.dont_write_bytecode = dont_write_bytecode
     
     if missing_packages:
         print(f"Отсутствующие пакеты: {', '.join(missing_packages)}")
@@ -87,6 +155,13 @@ def check_dependencies():
         return False
     
     print("Все зависимости установлены.")
+    
+    try:
+        with open(DEPCHECK_CACHE, "w", encoding="utf-8") as f:
+            json.dump({"mtime": requirements_mtime, "python": sys.executable, "ok": True}, f)
+    except OSError as e:
+        print(f"Предупреждение: Не удалось сохранить результат проверки зависимостей: {e}")
+    
     return True
 
 
@@ -101,9 +176,20 @@ def check_resources():
         "resources/locales/en.json"
     ]
     
+    # Один проход os.scandir по каждой директории вместо отдельного stat на каждый файл
+    existing_files = set()
+    for directory in {os.path.dirname(file_path) for file_path in required_files}:
+        try:
+            with os.scandir(directory) as entries:
+                existing_files.update(
+                    f"{directory}/{entry.name}" for entry in entries if entry.is_file()
+                )
+        except OSError:
+            pass
+    
     missing_files = []
     for file_path in required_files:
-        if not os.path.exists(file_path):
+        if file_path not in existing_files:
             missing_files.append(file_path)
             print(f"✗ {file_path} не найден")
         else:
@@ -117,6 +203,22 @@ def check_resources():
     return True
 
 
+def collect_ssl_binaries():
+    """Собирает список существующих бинарных файлов SSL для включения в сборку"""
+    patterns = (
+        os.path.join(sys.prefix, "DLLs", "_ssl.pyd"),
+        os.path.join(sys.prefix, "DLLs", "_socket.pyd"),
+        os.path.join(sys.prefix, "Library", "bin", "libssl*.dll"),
+        os.path.join(sys.prefix, "Library", "bin", "libcrypto*.dll"),
+    )
+    
+    ssl_binaries = set()
+    for pattern in patterns:
+        ssl_binaries.update(glob.glob(pattern))
+    
+    return sorted(ssl_binaries)
+
+
 def build_app():
     """Сборка приложения с помощью PyInstaller"""
     print("=" * 50)
@@ -134,6 +236,10 @@ def build_app():
     # Очистка артефактов
     clean_build_artifacts()
     
+    # Обновление встроенных переводов из JSON файлов локализации
+    if subprocess.run([sys.executable, os.path.join("resources", "bundle_locales.py")]).returncode:
+        return 1
+    
     # Имя приложения и версия
     app_name = "KSPVideoDownloader"
     version = datetime.now().strftime("%Y.%m.%d")
@@ -154,6 +260,8 @@ def build_app():
         "--strip",     # Удаление отладочной информации (только для Linux/macOS)
         # Использование runtime-hook для исправления SSL
         "--runtime-hook=ssl_hook.py",
+        # Корень проекта нужен для импорта пакета src из точки входа src/main.py
+        "--paths=.",
         # Явное включение необходимых модулей
         "--hidden-import=ssl",
         "--hidden-import=_ssl",
@@ -165,18 +273,19 @@ def build_app():
         "--hidden-import=unicodedata",
         # Отключение оптимизаций, которые могут вызывать проблемы с DLL
         "--noupx",
+        # Исключение неиспользуемых модулей стандартной библиотеки
+        *[f"--exclude-module={module}" for module in EXCLUDED_MODULES],
         # Включение всех бинарных зависимостей
         "--collect-all", "yt_dlp",
         "--collect-all", "certifi",
-        # Добавление бинарных файлов SSL
-        "--add-binary", f"{sys.prefix}\\DLLs\\_ssl.pyd;.",
-        "--add-binary", f"{sys.prefix}\\DLLs\\_socket.pyd;.",
-        # Добавление SSL DLL файлов
-        "--add-binary", f"{sys.prefix}\\Library\\bin\\libssl*.dll;.",
-        "--add-binary", f"{sys.prefix}\\Library\\bin\\libcrypto*.dll;.",
-        "src/main.py"
     ]
     
+    # Добавление бинарных файлов SSL (только реально существующих)
+    for binary_path in collect_ssl_binaries():
+        cmd += ["--add-binary", f"{binary_path}{os.pathsep}."]
+    
+    cmd.append("src/main.py")
+    
     # Удаление --strip для Windows
     if sys.platform == "win32":
         cmd.remove("--strip")
@@ -188,14 +297,22 @@ def build_app():
     # Запуск PyInstaller
     try:
         print("Запуск PyInstaller...")
-        result = subprocess.run(cmd, check=True, capture_output=True, text=True)
+        # Не сохраняем таблицы позиций в байт-коде для уменьшения размера архива
+        env = dict(os.environ, PYTHONNODEBUGRANGES="1")
         
+        # Выводим лог PyInstaller по мере поступления, сохраняя только его хвост
+        # для отчета об ошибке
         print("Вывод PyInstaller:")
-        print(result.stdout)
+        output_tail = deque(maxlen=OUTPUT_TAIL_LINES)
+        with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                              text=True, bufsize=1, env=env) as process:
+            for line in process.stdout:
+                print(line, end="")
+                output_tail.append(line)
+            returncode = process.wait()
         
-        if result.stderr:
-            print("Предупреждения:")
-            print(result.stderr)
+        if returncode:
+            raise subprocess.CalledProcessError(returncode, cmd, output="".join(output_tail))
         
         # Проверка результата
         exe_path = os.path.join("dist", f"{app_name}.exe" if sys.platform == "win32" else app_name)
@@ -216,7 +333,7 @@ def build_app():
         print("✗ Ошибка при сборке!")
         print(f"Код ошибки: {e.returncode}")
         if e.stdout:
-            print("Вывод:")
+            print("Последние строки вывода:")
             print(e.stdout)
         if e.stderr:
             print("Ошибки:")
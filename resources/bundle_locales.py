@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import json
+
+
+# Языки, переводы которых встраиваются в приложение
+BUNDLED_LANGUAGES = ("ru", "en")
+
+
+def bundle_locales():
+    """Генерирует Python-модуль со встроенными переводами из JSON файлов локализации"""
+    try:
+        resources_dir = os.path.dirname(os.path.abspath(__file__))
+        locales_dir = os.path.join(resources_dir, 'locales')
+        module_path = os.path.join(os.path.dirname(resources_dir), 'src', 'core', 'locales_bundled.py')
+        
+        translations = {}
+        for lang_code in BUNDLED_LANGUAGES:
+            lang_path = os.path.join(locales_dir, f"{lang_code}.json")
+            if not os.path.exists(lang_path):
+                print(f"Ошибка: Файл {lang_path} не найден.")
+                return 1
+            with open(lang_path, 'r', encoding='utf-8') as f:
+                translations[lang_code] = json.load(f)
+        
+        lines = [
+            "#!/usr/bin/env python3",
+            "# -*- coding: utf-8 -*-",
+            "",
+            '"""',
+            "Встроенные переводы приложения",
+            "",
+            "Файл сгенерирован скриптом resources/bundle_locales.py из resources/locales/*.json,",
+            "не редактируйте его вручную",
+            '"""',
+            "",
+            "TRANSLATIONS = {",
+        ]
+        for lang_code, texts in translations.items():
+            lines.append(f"    {lang_code!r}: {{")
+            lines.extend(f"        {key!r}: {text!r}," for key, text in texts.items())
+            lines.append("    },")
+        lines.append("}")
+        
+        with open(module_path, 'w', encoding='utf-8') as f:
+            f.write("\n".join(lines) + "\n")
+        
+        print(f"Переводы успешно встроены в {module_path}")
+        return 0
+    
+    except Exception as e:
+        print(f"Ошибка при генерации встроенных переводов: {e}")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(bundle_locales())
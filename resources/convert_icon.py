@@ -6,6 +6,45 @@ import sys
 import subprocess
 
 
+# Размеры изображений в ICO файле (по возрастанию)
+ICON_SIZES = (16, 32, 48, 64, 128, 256)
+
+
+def render_with_inkscape(svg_path, sizes):
+    """Растеризует SVG во все размеры одним процессом Inkscape в режиме --shell
+    
+    Returns:
+        Список изображений PIL в порядке sizes
+    """
+    import tempfile
+    from PIL import Image
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        png_paths = [os.path.join(temp_dir, f"icon_{size}.png") for size in sizes]
+        commands = "".join(
+            f"file-open:{svg_path}; export-filename:{png_path}; "
+            f"export-width:{size}; export-height:{size}; export-do; file-close\n"
+            for size, png_path in zip(sizes, png_paths)
+        )
+        
+        # Все команды передаются через stdin, Inkscape завершается по концу ввода
+        proc = subprocess.Popen(
+            ["inkscape", "--shell"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            text=True
+        )
+        proc.communicate(commands)
+        if proc.returncode:
+            raise subprocess.CalledProcessError(proc.returncode, proc.args)
+        
+        images = []
+        for png_path in png_paths:
+            with Image.open(png_path) as img:
+                images.append(img.copy())
+        return images
+
+
 def convert_svg_to_ico():
     """Конвертирует SVG иконку в ICO формат для Windows"""
     try:
@@ -21,25 +60,16 @@ def convert_svg_to_ico():
         try:
             # Попытка использовать Inkscape для конвертации
             print("Попытка использовать Inkscape для конвертации...")
-            subprocess.run(
-                [
-                    "inkscape", 
-                    "--export-filename=temp.png", 
-                    "--export-width=256", 
-                    "--export-height=256", 
-                    svg_path
-                ], 
-                check=True
-            )
+            images = render_with_inkscape(svg_path, ICON_SIZES)
             
-            # Конвертация PNG в ICO с помощью PIL
+            # Сборка ICO из изображений всех размеров с помощью PIL
             print("Конвертация PNG в ICO...")
-            from PIL import Image
-            img = Image.open("temp.png")
-            img.save(ico_path, sizes=[(16, 16), (32, 32), (48, 48), (64, 64), (128, 128), (256, 256)])
-            
-            # Удаление временного файла
-            os.remove("temp.png")
+            images[-1].save(
+                ico_path,
+                format="ICO",
+                sizes=[(size, size) for size in ICON_SIZES],
+                append_images=images[:-1]
+            )
             
         except (subprocess.SubprocessError, FileNotFoundError):
             # Если Inkscape не установлен, используем прямую конвертацию через PIL
@@ -47,12 +77,24 @@ def convert_svg_to_ico():
             try:
                 import cairosvg
                 import io
+                from concurrent.futures import ThreadPoolExecutor
                 from PIL import Image
                 
-                # Конвертация SVG в PNG в памяти
-                png_data = cairosvg.svg2png(url=svg_path, output_width=256, output_height=256)
-                img = Image.open(io.BytesIO(png_data))
-                img.save(ico_path, sizes=[(16, 16), (32, 32), (48, 48), (64, 64), (128, 128), (256, 256)])
+                # Растеризуем SVG сразу в каждый размер иконки (параллельно, cairo
+                # отпускает GIL), вместо уменьшения одного PNG 256x256 средствами PIL
+                def render(size):
+                    png_data = cairosvg.svg2png(url=svg_path, output_width=size, output_height=size)
+                    return Image.open(io.BytesIO(png_data))
+                
+                with ThreadPoolExecutor() as executor:
+                    images = list(executor.map(render, ICON_SIZES))
+                
+                images[-1].save(
+                    ico_path,
+                    format="ICO",
+                    sizes=[(size, size) for size in ICON_SIZES],
+                    append_images=images[:-1]
+                )
                 
             except ImportError:
                 print("Ошибка: Для конвертации необходимо установить cairosvg и Pillow:")
@@ -13,9 +13,17 @@ def run_tests():
     sys.path.insert(0, os.path.join(project_root, "src"))
     sys.path.insert(0, project_root)
     
-    # Обнаружение и запуск тестов
-    test_loader = unittest.TestLoader()
-    test_suite = test_loader.discover('tests', pattern='test_*.py')
+    # Тесты не пишут лог в файл
+    os.environ.setdefault('KSP_NO_FILE_LOG', '1')
+    
+    # Обнаружение тестов без записи байт-кода в __pycache__
+    dont_write_bytecode = sys.dont_write_bytecode
+    sys.dont_write_bytecode = True
+    try:
+        test_loader = unittest.TestLoader()
+        test_suite = test_loader.discover('tests', pattern='test_*.py')
+    finally:
+        sys.dont_write_bytecode = dont_write_bytecode
     
     # Запуск тестов с подробным выводом
     test_runner = unittest.TextTestRunner(verbosity=2)
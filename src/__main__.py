@@ -0,0 +1,11 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Запуск приложения как пакета: python -m src
+"""
+
+from src.main import main
+
+
+main()
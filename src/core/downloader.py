@@ -4,14 +4,59 @@
 import os
 import sys
 import time
-from typing import Callable, Optional, Tuple, Dict, Any
-
-import yt_dlp
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, Tuple, Dict, Any, List, Union
 
 from src.core.logger import get_logger
 from src.core.localization import get_localization, _
 
 
+# Минимальный интервал между обновлениями прогресса загрузки, в секундах (не чаще 20 Гц)
+PROGRESS_UPDATE_INTERVAL = 0.05
+
+# Делители для единиц измерения размера: Б, КБ, МБ, ГБ, ТБ, ПБ
+_SIZE_DIVISORS = tuple(1 << (10 * i) for i in range(6))
+
+# Количество одновременных загрузок по умолчанию для download_many
+DEFAULT_CONCURRENCY = 4
+
+# Шаблоны строки формата yt-dlp для видео; {codec} заменяется на идентификатор кодека
+_VIDEO_FORMAT_TEMPLATES = {
+    "1080": "bestvideo[height<=1080][vcodec*={codec}]+bestaudio/best[height<=1080]/bestvideo[height<=1080]+bestaudio/best",
+    "720": "bestvideo[height<=720][vcodec*={codec}]+bestaudio/best[height<=720]/bestvideo[height<=720]+bestaudio/best",
+    "480": "bestvideo[height<=480][vcodec*={codec}]+bestaudio/best[height<=480]/bestvideo[height<=480]+bestaudio/best",
+    "best": "bestvideo[vcodec*={codec}]+bestaudio/bestvideo+bestaudio/best",
+}
+
+# Форматы, для которых извлекается только аудиодорожка
+_AUDIO_FORMATS = ("mp3", "m4a")
+
+
+@functools.lru_cache(maxsize=16)
+def _build_format_options(format_option: str, codec: str) -> Dict[str, Any]:
+    """Строит опции yt-dlp для формата и кодека (результат кэшируется, не изменять)"""
+    if format_option in _AUDIO_FORMATS:
+        return {
+            'format': 'bestaudio/best',
+            'postprocessors': [{
+                'key': 'FFmpegExtractAudio',
+                'preferredcodec': format_option,
+                'preferredquality': '192',
+            }],
+        }
+    
+    # Определяем кодек для видео форматов
+    video_codec = "avc" if codec == "h264" else "av01"
+    template = _VIDEO_FORMAT_TEMPLATES.get(format_option, _VIDEO_FORMAT_TEMPLATES["best"])
+    return {'format': template.format(codec=video_codec)}
+
+
+class DownloadCancelled(Exception):
+    """Загрузка отменена по запросу"""
+
+
 class VideoDownloader:
     """Класс для загрузки видео с использованием yt-dlp"""
     
@@ -19,11 +64,79 @@ class VideoDownloader:
         self.ydl_opts = {}
         self.current_download = None
         self.logger = get_logger()
+        # Экземпляры YoutubeDL, переиспользуемые между загрузками с одинаковыми настройками
+        self._ydl_cache: Dict[Tuple, Any] = {}
+        # Хук прогресса текущей загрузки (закэшированные YoutubeDL вызывают его через _dispatch_progress)
+        self._active_hook: Optional[Callable[[Dict[str, Any]], None]] = None
+        # Событие отмены текущей загрузки
+        self._cancel_event: Optional[threading.Event] = None
+        self.refresh_locale()
+    
+    @functools.cached_property
+    def _yt_dlp(self):
+        """Модуль yt_dlp, импортируемый при первой загрузке
+        
+        Импорт yt_dlp регистрирует все экстракторы и заметно замедляет запуск приложения
+        """
+        import yt_dlp
+        return yt_dlp
+    
+    def refresh_locale(self) -> None:
+        """Обновляет закэшированные локализованные единицы измерения
+        
+        Вызывается при смене языка интерфейса
+        """
+        units = tuple(_(key) for key in ("unit_bytes", "unit_kb", "unit_mb", "unit_gb", "unit_tb", "unit_pb"))
+        # Пары (делитель, единица измерения) для _format_size
+        self._size_table = tuple(zip(_SIZE_DIVISORS, units))
+    
+    def close(self) -> None:
+        """Закрывает закэшированные экземпляры YoutubeDL"""
+        for ydl in self._ydl_cache.values():
+            try:
+                ydl.close()
+            except Exception as e:
+                self.logger.warning(f"Ошибка при закрытии YoutubeDL: {e}")
+        self._ydl_cache.clear()
+    
+    def _get_ydl(self, cache_key: Tuple, ydl_opts: Dict[str, Any]) -> Any:
+        """Возвращает закэшированный экземпляр YoutubeDL для указанных настроек или создает новый"""
+        ydl = self._ydl_cache.get(cache_key)
+        if ydl is None:
+            ydl = self._yt_dlp.YoutubeDL(ydl_opts)
+            self._ydl_cache[cache_key] = ydl
+        return ydl
+    
+    def _check_cancel(self, d: Optional[Dict[str, Any]] = None) -> None:
+        """Прерывает загрузку, если запрошена отмена
+        
+        Вызывается перед загрузкой и из хуков yt-dlp (прогресса и постобработки):
+        исключение из хука штатно раскручивает стек yt-dlp, и тот закрывает
+        соединение и файл
+        """
+        if self._cancel_event is not None and self._cancel_event.is_set():
+            raise self._yt_dlp.utils.DownloadError("Загрузка отменена")
+    
+    def _dispatch_progress(self, d: Dict[str, Any]) -> None:
+        """Передает событие прогресса хуку текущей загрузки"""
+        self._check_cancel()
+        if self._active_hook is not None:
+            self._active_hook(d)
     
     def _progress_hook(self, progress_callback: Callable[[float, str], None]) -> Callable:
         """Создает функцию-хук для отслеживания прогресса загрузки"""
+        # Время последнего вызова колбэка для статуса 'downloading'
+        last_update = [0.0]
+        
         def hook(d: Dict[str, Any]) -> None:
             if d['status'] == 'downloading':
+                # yt-dlp вызывает хук на каждый полученный блок данных, поэтому
+                # ограничиваем частоту обновлений; смена статуса передается всегда
+                now = time.monotonic()
+                if now - last_update[0] < PROGRESS_UPDATE_INTERVAL:
+                    return
+                last_update[0] = now
+                
                 # Получение процента загрузки
                 if 'total_bytes' in d and d['total_bytes'] > 0:
                     percent = d['downloaded_bytes'] / d['total_bytes'] * 100
@@ -48,7 +161,8 @@ class VideoDownloader:
                 
                 # Формирование статуса
                 filename = os.path.basename(d['filename'])
-                status = _("status_downloading").format(
+                status = _(
+                    "status_downloading",
                     progress=f"{percent:.1f}", 
                     speed=speed_str, 
                     eta=eta_str
@@ -60,36 +174,40 @@ class VideoDownloader:
             elif d['status'] == 'finished':
                 filename = os.path.basename(d['filename'])
                 self.logger.info(f"Загрузка файла завершена: {filename}. Начало обработки.")
-                progress_callback(100, _("status_processing").format(filename=filename))
+                progress_callback(100, _("status_processing", filename=filename))
             
             elif d['status'] == 'error':
                 error_msg = d.get('error', 'Неизвестная ошибка')
                 self.logger.error(f"Ошибка загрузки: {error_msg}")
-                progress_callback(0, _("status_error").format(error=error_msg))
+                progress_callback(0, _("status_error", error=error_msg))
         
         return hook
     
+    def _raise_if_cancelled(self, url: str, error: Exception) -> None:
+        """Заменяет ошибку прерванной загрузки на DownloadCancelled, если была запрошена отмена"""
+        if self._cancel_event is not None and self._cancel_event.is_set():
+            self.logger.info(f"Загрузка отменена: {url}")
+            raise DownloadCancelled() from error
+    
     def _format_size(self, bytes_: int) -> str:
         """Форматирует размер в байтах в человекочитаемый формат"""
-        # Используем локализованные единицы измерения
-        units = [_("unit_bytes"), _("unit_kb"), _("unit_mb"), _("unit_gb"), _("unit_tb")]
-        for unit in units:
-            if bytes_ < 1024.0:
-                return f"{bytes_:.2f} {unit}"
-            bytes_ /= 1024.0
-        return f"{bytes_:.2f} {_("unit_pb")}"
+        # Номер единицы измерения равен floor(log2(размер)) // 10; значения
+        # от петабайта и больше выводятся в петабайтах
+        index = (int(bytes_).bit_length() - 1) // 10
+        divisor, unit = self._size_table[min(max(index, 0), len(self._size_table) - 1)]
+        return f"{bytes_ / divisor:.2f} {unit}"
     
     def _format_time(self, seconds: int) -> str:
         """Форматирует время в секундах в человекочитаемый формат"""
         if seconds < 60:
-            return _("time_seconds").format(seconds=seconds)
+            return _("time_seconds", seconds=seconds)
         elif seconds < 3600:
             minutes, seconds = divmod(seconds, 60)
-            return _("time_minutes_seconds").format(minutes=minutes, seconds=seconds)
+            return _("time_minutes_seconds", minutes=minutes, seconds=seconds)
         else:
             hours, remainder = divmod(seconds, 3600)
             minutes, seconds = divmod(remainder, 60)
-            return _("time_hours_minutes").format(hours=hours, minutes=minutes)
+            return _("time_hours_minutes", hours=hours, minutes=minutes)
     
     def _get_format_options(self, format_option: str, codec: str = "h264") -> Dict[str, Any]:
         """Возвращает опции yt-dlp в зависимости от выбранного формата и кодека
@@ -98,47 +216,12 @@ class VideoDownloader:
             format_option: Опция формата (mp3, m4a, 720, 480, best)
             codec: Кодек видео (h264 или av1)
         """
-        # Определяем кодек для видео форматов
-        video_codec = "avc" if codec == "h264" else "av01"
-        
-        if format_option == "mp3":
-            return {
-                'format': 'bestaudio/best',
-                'postprocessors': [{
-                    'key': 'FFmpegExtractAudio',
-                    'preferredcodec': 'mp3',
-                    'preferredquality': '192',
-                }],
-            }
-        elif format_option == "m4a":
-            return {
-                'format': 'bestaudio/best',
-                'postprocessors': [{
-                    'key': 'FFmpegExtractAudio',
-                    'preferredcodec': 'm4a',
-                    'preferredquality': '192',
-                }],
-            }
-        elif format_option == "720":
-            return {
-                'format': f'bestvideo[height<=720][vcodec*={video_codec}]+bestaudio/best[height<=720]/bestvideo[height<=720]+bestaudio/best',
-            }
-        elif format_option == "1080":
-            return {
-                'format': f'bestvideo[height<=1080][vcodec*={video_codec}]+bestaudio/best[height<=1080]/bestvideo[height<=1080]+bestaudio/best',
-            }
-        elif format_option == "480":
-            return {
-                'format': f'bestvideo[height<=480][vcodec*={video_codec}]+bestaudio/best[height<=480]/bestvideo[height<=480]+bestaudio/best',
-            }
-        else:  # best
-            return {
-                'format': f'bestvideo[vcodec*={video_codec}]+bestaudio/bestvideo+bestaudio/best',
-            }
+        return dict(_build_format_options(format_option, codec))
     
     def download(self, url: str, output_path: str, format_option: str, 
                  progress_callback: Optional[Callable[[float, str], None]] = None,
-                 codec: str = "h264", referrer: str = None) -> str:
+                 codec: str = "h264", referrer: str = None,
+                 cancel_event: Optional[threading.Event] = None) -> str:
         """Загружает видео по указанному URL
         
         Args:
@@ -148,13 +231,17 @@ class VideoDownloader:
             progress_callback: Функция обратного вызова для отслеживания прогресса
             codec: Кодек видео (h264 или av1)
             referrer: Referrer для HTTP-запроса (используется для Kinescope)
+            cancel_event: Событие, установка которого прерывает загрузку
+        
+        Raises:
+            DownloadCancelled: Если загрузка прервана через cancel_event
         """
         self.logger.info(f"Начало загрузки видео: {url}")
         self.logger.info(f"Путь сохранения: {output_path}, формат: {format_option}, кодек: {codec}")
         
         # Создание директории для загрузки, если она не существует
         os.makedirs(output_path, exist_ok=True)
-        self.logger.debug(f"Директория для загрузки создана/проверена: {output_path}")
+        self.logger.debug("Директория для загрузки создана/проверена: %s", output_path)
         
         # Базовые опции
         ydl_opts = {
@@ -175,33 +262,39 @@ class VideoDownloader:
         format_opts = self._get_format_options(format_option, codec)
         ydl_opts.update(format_opts)
         
-        # Добавление хука прогресса, если предоставлен колбэк
-        if progress_callback:
-            ydl_opts['progress_hooks'] = [self._progress_hook(progress_callback)]
+        # Хук прогресса регистрируется один раз на экземпляр YoutubeDL и вызывает
+        # колбэк текущей загрузки
+        ydl_opts['progress_hooks'] = [self._dispatch_progress]
+        # Отмена проверяется и между шагами постобработки (ffmpeg)
+        ydl_opts['postprocessor_hooks'] = [self._check_cancel]
+        self._active_hook = self._progress_hook(progress_callback) if progress_callback else None
+        self._cancel_event = cancel_event
         
         # Загрузка видео
         try:
-            self.logger.debug(f"Настройки загрузки: {ydl_opts}")
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                self.logger.info("Извлечение информации о видео...")
-                info = ydl.extract_info(url, download=True)
+            self.logger.debug("Настройки загрузки: %s", ydl_opts)
+            ydl = self._get_ydl((format_option, codec, referrer, output_path), ydl_opts)
+            self.logger.info("Извлечение информации о видео...")
+            self._check_cancel()
+            info = ydl.extract_info(url, download=True)
+            
+            if info:
+                # Получаем путь к загруженному файлу
+                filename = ydl.prepare_filename(info)
+                # Проверяем расширение файла, так как оно может измениться после постобработки
+                if 'ext' in info and not filename.endswith(info['ext']):
+                    base_filename = os.path.splitext(filename)[0]
+                    filename = f"{base_filename}.{info['ext']}"
                 
-                if info:
-                    # Получаем путь к загруженному файлу
-                    filename = ydl.prepare_filename(info)
-                    # Проверяем расширение файла, так как оно может измениться после постобработки
-                    if 'ext' in info and not filename.endswith(info['ext']):
-                        base_filename = os.path.splitext(filename)[0]
-                        filename = f"{base_filename}.{info['ext']}"
-                    
-                    result_file = os.path.join(output_path, os.path.basename(filename))
-                    self.logger.info(f"Загрузка завершена успешно: {result_file}")
-                    return result_file
-                else:
-                    error_msg = "Не удалось получить информацию о видео"
-                    self.logger.error(error_msg)
-                    raise Exception(_("error_no_video_info"))
-        except yt_dlp.utils.ExtractorError as e:
+                result_file = os.path.join(output_path, os.path.basename(filename))
+                self.logger.info(f"Загрузка завершена успешно: {result_file}")
+                return result_file
+            else:
+                error_msg = "Не удалось получить информацию о видео"
+                self.logger.error(error_msg)
+                raise Exception(_("error_no_video_info"))
+        except self._yt_dlp.utils.ExtractorError as e:
+            self._raise_if_cancelled(url, e)
             error_msg = f"Ошибка экстрактора при загрузке видео: {str(e)}"
             self.logger.error(error_msg, exc_info=True)
             # Проверяем, если это ошибка формата, пробуем с базовым форматом
@@ -212,7 +305,8 @@ class VideoDownloader:
                     ydl_opts_fallback = ydl_opts.copy()
                     ydl_opts_fallback['format'] = 'best'
                     
-                    with yt_dlp.YoutubeDL(ydl_opts_fallback) as ydl:
+                    self._check_cancel()
+                    with self._yt_dlp.YoutubeDL(ydl_opts_fallback) as ydl:
                         info = ydl.extract_info(url, download=True)
                         if info:
                             filename = ydl.prepare_filename(info)
@@ -224,14 +318,72 @@ class VideoDownloader:
                             self.logger.info(f"Загрузка завершена успешно (fallback): {result_file}")
                             return result_file
                 except Exception as fallback_e:
+                    self._raise_if_cancelled(url, fallback_e)
                     self.logger.error(f"Fallback загрузка также не удалась: {str(fallback_e)}")
             
             raise Exception(_("error_download_failed"))
-        except yt_dlp.utils.DownloadError as e:
+        except self._yt_dlp.utils.DownloadError as e:
+            self._raise_if_cancelled(url, e)
             error_msg = f"Ошибка загрузки: {str(e)}"
             self.logger.error(error_msg, exc_info=True)
             raise Exception(_("error_download_failed"))
         except Exception as e:
+            self._raise_if_cancelled(url, e)
             error_msg = f"Неожиданная ошибка при загрузке видео: {str(e)}"
             self.logger.error(error_msg, exc_info=True)
-            raise Exception(_("error_download_failed"))
\ No newline at end of file
+            raise Exception(_("error_download_failed"))
+    
+    def download_many(self, urls: List[str], output_path: str, format_option: str,
+                      progress_callback: Optional[Callable[[str, float, str], None]] = None,
+                      codec: str = "h264", referrer: str = None,
+                      concurrency: int = DEFAULT_CONCURRENCY,
+                      cancel_event: Optional[threading.Event] = None) -> List[Union[str, Exception]]:
+        """Загружает несколько видео параллельно
+        
+        Каждый рабочий поток использует собственный VideoDownloader: закэшированные
+        экземпляры YoutubeDL и хук прогресса не рассчитаны на работу из нескольких потоков.
+        Ошибка одной загрузки не прерывает остальные.
+        
+        Args:
+            urls: Список URL видео для загрузки
+            output_path: Путь для сохранения файлов
+            format_option: Опция формата (mp3, m4a, 720, 480, best)
+            progress_callback: Функция обратного вызова для отслеживания прогресса;
+                первым аргументом получает URL видео, к которому относится прогресс
+            codec: Кодек видео (h264 или av1)
+            referrer: Referrer для HTTP-запроса (используется для Kinescope)
+            concurrency: Максимальное количество одновременных загрузок
+            cancel_event: Событие, установка которого прерывает все загрузки
+        
+        Returns:
+            Для каждого URL в порядке следования путь к загруженному файлу
+            или исключение, с которым завершилась его загрузка
+        """
+        def download_with(downloader: 'VideoDownloader', url: str) -> Union[str, Exception]:
+            callback = functools.partial(progress_callback, url) if progress_callback else None
+            try:
+                return downloader.download(url, output_path, format_option, callback, codec, referrer,
+                                           cancel_event=cancel_event)
+            except Exception as e:
+                return e
+        
+        if concurrency <= 1 or len(urls) <= 1:
+            return [download_with(self, url) for url in urls]
+        
+        local = threading.local()
+        downloaders = []
+        
+        def download_one(url: str) -> Union[str, Exception]:
+            downloader = getattr(local, 'downloader', None)
+            if downloader is None:
+                downloader = local.downloader = VideoDownloader()
+                downloaders.append(downloader)
+            return download_with(downloader, url)
+        
+        self.logger.info(f"Пакетная загрузка {len(urls)} видео, потоков: {concurrency}")
+        try:
+            with ThreadPoolExecutor(max_workers=min(concurrency, len(urls))) as executor:
+                return list(executor.map(download_one, urls))
+        finally:
+            for downloader in downloaders:
+                downloader.close()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import os
+import json
+import mmap
+
+# orjson разбирает JSON быстрее стандартного модуля, но необязателен;
+# orjson.JSONDecodeError наследуется от json.JSONDecodeError
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# ijson позволяет не разбирать весь JSON файл Kinescope целиком, но необязателен
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+
+def find_m3u8_url(data):
+    """Ищет в разобранном JSON URL видео: значение shakahls или строку с .m3u8
+    
+    Обход выполняется итеративно в порядке следования значений в документе.
+    Правило выбора то же, что и при потоковом разборе в _scan_kinescope_json:
+    первое значение shakahls на любом уровне, иначе первая строка с .m3u8
+    
+    Returns:
+        Найденный URL или None
+    """
+    m3u8_url = None
+    stack = [(None, data)]
+    while stack:
+        key, value = stack.pop()
+        if isinstance(value, str):
+            if key == 'shakahls':
+                return value
+            if m3u8_url is None and '.m3u8' in value:
+                m3u8_url = value
+        elif isinstance(value, dict):
+            stack.extend(reversed(list(value.items())))
+        elif isinstance(value, list):
+            stack.extend((None, item) for item in reversed(value))
+    return m3u8_url
+
+
+def _load_json(file_path):
+    """Читает и разбирает JSON файл целиком
+    
+    С orjson файл отображается в память и разбирается без копирования в строку
+    """
+    with open(file_path, 'rb') as f:
+        if orjson is None:
+            return json.loads(f.read())
+        # Пустой файл нельзя отобразить в память; orjson сообщит об ошибке разбора
+        if os.fstat(f.fileno()).st_size == 0:
+            return orjson.loads(b'')
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+            return orjson.loads(view)
+
+
+def _scan_kinescope_json(file_path):
+    """Потоково читает JSON файл через ijson, останавливаясь на найденных полях
+    
+    Returns:
+        Кортеж (referrer, URL видео)
+    """
+    referrer = shakahls = m3u8_url = None
+    with open(file_path, 'rb') as f:
+        events = ijson.parse(f)
+        # referrer и shakahls ищутся только в JSON-объекте
+        if next(events, (None, None, None))[1] != 'start_map':
+            return None, None
+        
+        for prefix, event, value in events:
+            if event != 'string':
+                continue
+            if prefix == 'referrer':
+                referrer = value
+            if shakahls is None and (prefix == 'shakahls' or prefix.endswith('.shakahls')):
+                shakahls = value
+            if m3u8_url is None and '.m3u8' in value:
+                m3u8_url = value
+            if referrer is not None and shakahls is not None:
+                break
+    return referrer, shakahls or m3u8_url
+
+
+def read_kinescope_json(file_path):
+    """Извлекает из JSON файла Kinescope referrer (из корня JSON) и URL видео
+    
+    Returns:
+        Кортеж (referrer, URL видео); отсутствующие значения равны None
+    
+    Raises:
+        json.JSONDecodeError: Если файл не является корректным JSON
+    """
+    if ijson is not None:
+        try:
+            return _scan_kinescope_json(file_path)
+        except ijson.JSONError:
+            # Полный разбор ниже сообщит о некорректном JSON стандартной ошибкой
+            pass
+    
+    data = _load_json(file_path)
+    if not isinstance(data, dict):
+        return None, None
+    return data.get('referrer'), find_m3u8_url(data)
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Встроенные переводы приложения
+
+Файл сгенерирован скриптом resources/bundle_locales.py из resources/locales/*.json,
+не редактируйте его вручную
+"""
+
+TRANSLATIONS = {
+    'ru': {
+        'app_title': 'KSP Video Downloader',
+        'url_label': 'URL видео:',
+        'format_label': 'Формат:',
+        'save_path_label': 'Путь сохранения:',
+        'browse_button': 'Обзор',
+        'download_button': 'Загрузить',
+        'cancel_button': 'Отмена',
+        'status_ready': 'Готов к загрузке',
+        'status_downloading': 'Загрузка: {progress}% - {speed} - Осталось: {eta}',
+        'status_complete': 'Загрузка завершена: {filename}',
+        'status_error': 'Ошибка: {error}',
+        'format_best': 'Лучшее качество',
+        'format_720p': '720p',
+        'format_1080p': '1080p',
+        'format_480p': '480p',
+        'format_360p': '360p',
+        'format_mp3': 'MP3 (только аудио)',
+        'error_invalid_url': 'Неверный URL видео',
+        'error_network': 'Ошибка сети',
+        'error_permission': 'Ошибка доступа к файлу',
+        'dialog_title_browse': 'Выберите директорию для сохранения',
+        'dialog_title_error': 'Ошибка',
+        'dialog_title_info': 'Информация',
+        'dialog_msg_complete': 'Загрузка завершена успешно!',
+        'language_changed': 'Язык изменен. Приложение будет перезапущено для применения изменений.',
+        'language_change_error': 'Ошибка при смене языка. Выбранный язык недоступен.',
+        'general_tab': 'Общие',
+        'kinescope_tab': 'Kinescope',
+        'language_label': 'Язык:',
+        'manual_input': 'Ручной ввод',
+        'file_input': 'Загрузка из файла',
+        'drag_drop_hint': 'Перетащите JSON файл сюда или нажмите кнопку выбора',
+        'select_file_button': 'Выбрать файл',
+        'referrer_label': 'Referrer:',
+        'video_url_label': 'URL видео:',
+        'filename_label': 'Имя файла:',
+        'codec_label': 'Кодек:',
+        'codec_help': 'Справка по кодекам',
+        'time_seconds': '{seconds} сек',
+        'time_minutes_seconds': '{minutes} мин {seconds} сек',
+        'time_hours_minutes': '{hours} ч {minutes} мин',
+        'status_cancelling': 'Отмена загрузки...',
+        'unit_bytes': 'Б',
+        'unit_kb': 'КБ',
+        'unit_mb': 'МБ',
+        'unit_gb': 'ГБ',
+        'unit_tb': 'ТБ',
+        'unit_pb': 'ПБ',
+    },
+    'en': {
+        'app_title': 'KSP Video Downloader',
+        'url_label': 'Video URL:',
+        'format_label': 'Format:',
+        'save_path_label': 'Save path:',
+        'browse_button': 'Browse',
+        'download_button': 'Download',
+        'cancel_button': 'Cancel',
+        'status_ready': 'Ready to download',
+        'status_downloading': 'Downloading: {progress}% - {speed} - ETA: {eta}',
+        'status_complete': 'Download complete: {filename}',
+        'status_error': 'Error: {error}',
+        'format_best': 'Best quality',
+        'format_720p': '720p',
+        'format_1080p': '1080p',
+        'format_480p': '480p',
+        'format_360p': '360p',
+        'format_mp3': 'MP3 (audio only)',
+        'error_invalid_url': 'Invalid video URL',
+        'error_network': 'Network error',
+        'error_permission': 'File access error',
+        'dialog_title_browse': 'Select save directory',
+        'dialog_title_error': 'Error',
+        'dialog_title_info': 'Information',
+        'dialog_msg_complete': 'Download completed successfully!',
+        'language_changed': 'Language changed. The application will restart to apply changes.',
+        'language_change_error': 'Error changing language. Selected language is not available.',
+        'general_tab': 'General',
+        'kinescope_tab': 'Kinescope',
+        'language_label': 'Language:',
+        'manual_input': 'Manual input',
+        'file_input': 'File upload',
+        'drag_drop_hint': 'Drag and drop JSON file here or click select button',
+        'select_file_button': 'Select file',
+        'referrer_label': 'Referrer:',
+        'video_url_label': 'Video URL:',
+        'filename_label': 'Filename:',
+        'codec_label': 'Codec:',
+        'codec_help': 'Codec help',
+        'time_seconds': '{seconds} s',
+        'time_minutes_seconds': '{minutes} min {seconds} s',
+        'time_hours_minutes': '{hours} h {minutes} min',
+        'status_cancelling': 'Cancelling download...',
+        'unit_bytes': 'B',
+        'unit_kb': 'KB',
+        'unit_mb': 'MB',
+        'unit_gb': 'GB',
+        'unit_tb': 'TB',
+        'unit_pb': 'PB',
+    },
+}
@@ -2,14 +2,116 @@
 # -*- coding: utf-8 -*-
 
 import os
+import sys
 import json
-import locale
-from typing import Dict, Any
+import string
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Set, Tuple, Optional, Any
+
+# orjson разбирает JSON в несколько раз быстрее стандартного модуля, но необязателен
+try:
+    import orjson
+    
+    _loads = orjson.loads
+    
+    def _dumps(obj: Any, pretty: bool = False) -> bytes:
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+except ImportError:
+    _loads = json.loads
+    
+    def _dumps(obj: Any, pretty: bool = False) -> bytes:
+        if pretty:
+            return json.dumps(obj, ensure_ascii=False, indent=2).encode('utf-8')
+        return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+from src.core.locales_bundled import TRANSLATIONS as BUNDLED_TRANSLATIONS
+
+
+# Корневая директория приложения и директория с файлами локализации
+_APP_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_LOCALES_DIR = os.path.join(_APP_ROOT, 'resources', 'locales')
+
+# Преобразования полей шаблона (!s, !r, !a)
+_CONVERSIONS = {'s': str, 'r': repr, 'a': ascii}
+
+# Переменные окружения с настройками языка системы
+_LOCALE_ENV_VARS = ('LC_ALL', 'LC_CTYPE', 'LANG', 'LANGUAGE')
+
+# Основные идентификаторы языков Windows (младшие 10 бит LANGID) и коды языков
+_WINDOWS_LANGUAGES = {
+    0x09: 'en',
+    0x19: 'ru',
+    0x22: 'uk',
+    0x23: 'be',
+    0x3F: 'kk',
+    0x07: 'de',
+    0x0C: 'fr',
+    0x0A: 'es',
+    0x10: 'it',
+    0x04: 'zh',
+}
+
+# Максимальное число потоков для параллельного чтения файлов локализации
+_MAX_LOAD_WORKERS = 8
+
+
+def _read_locale(lang_code: str) -> Dict[str, str]:
+    """Читает и разбирает файл локализации для языка"""
+    with open(os.path.join(_LOCALES_DIR, f"{lang_code}.json"), 'rb') as f:
+        return _loads(f.read())
+
+
+def _compile_template(text: str) -> Optional[Callable[[Dict[str, Any]], str]]:
+    """Компилирует шаблон str.format в функцию подстановки параметров
+    
+    Шаблоны без спецификаций формата переводятся в %-шаблон, который
+    подставляет значения за одну операцию на уровне C. Для остальных
+    шаблонов используются заранее разобранные фрагменты строки.
+    
+    Returns:
+        Функция, принимающая словарь параметров, или None для шаблонов
+        с позиционными полями, обращениями к атрибутам/индексам
+        и вложенными полями в спецификации (их форматирует str.format)
+    """
+    segments = []
+    for literal, field, spec, conversion in string.Formatter().parse(text):
+        if field is not None and (not field.isidentifier() or '{' in spec):
+            return None
+        segments.append((literal, field, spec, conversion))
+    
+    if all(not spec for _, _, spec, _ in segments):
+        percent_template = ''.join(
+            literal.replace('%', '%%')
+            + (f"%({field}){conversion or 's'}" if field is not None else '')
+            for literal, field, _, conversion in segments
+        )
+        return percent_template.__mod__
+    
+    segments = tuple(segments)
+    
+    def render(kwargs: Dict[str, Any]) -> str:
+        parts = []
+        for literal, field, spec, conversion in segments:
+            parts.append(literal)
+            if field is not None:
+                value = kwargs[field]
+                if conversion:
+                    value = _CONVERSIONS[conversion](value)
+                parts.append(format(value, spec))
+        return ''.join(parts)
+    
+    return render
 
 
 class Localization:
     """Класс для локализации приложения"""
     
+    __slots__ = ('translations', 'current_lang', '_available', '_templates', '_active', '_fallback')
+    
     def __init__(self, lang: str = None):
         """Инициализация локализации
         
@@ -17,18 +119,16 @@ class Localization:
             lang: Код языка (ru, en, etc.). Если None, используется системный язык
         """
         self.translations: Dict[str, Dict[str, str]] = {}
+        # Коды языков, для которых есть только файлы локализации (загружаются по требованию)
+        self._available: Set[str] = set()
+        # Скомпилированные шаблоны строк с параметрами по (язык, ключ)
+        self._templates: Dict[Tuple[str, str], Optional[Callable[[Dict[str, Any]], str]]] = {}
+        # Переводы текущего языка и английские переводы для ключей, которых в нем нет
+        self._active: Dict[str, str] = {}
+        self._fallback: Dict[str, str] = {}
         self.current_lang = lang or self._get_system_language()
         self._load_translations()
-        
-    def set_language(self, lang: str) -> bool:
-        """Устанавливает текущий язык
-        
-        Возвращает True при успешной установке, иначе False
-        """
-        if lang in self.translations:
-            self.current_lang = lang
-            return True
-        return False
+        self._update_active()
         
     def get_available_languages(self) -> list:
         """Возвращает список доступных языков
@@ -36,7 +136,7 @@ class Localization:
         Returns:
             Список кодов языков
         """
-        return list(self.translations.keys())
+        return sorted(self._available | self.translations.keys())
     
     def _get_system_language(self) -> str:
         """Определяет язык системы
@@ -44,155 +144,148 @@ class Localization:
         Returns:
             Код языка (ru, en, etc.)
         """
-        try:
-            system_lang, _ = locale.getdefaultlocale()
-            if system_lang:
-                return system_lang.split('_')[0].lower()
-        except Exception:
-            pass
+        # Переменные окружения проверяются в том же порядке, что и в locale
+        for var in _LOCALE_ENV_VARS:
+            value = os.environ.get(var)
+            if value:
+                # LANGUAGE может содержать список языков через двоеточие
+                code = value.split(':')[0].split('.')[0].split('_')[0].lower()
+                if code and code not in ('c', 'posix'):
+                    return code
+        
+        if sys.platform == 'win32':
+            try:
+                import ctypes
+                lang_id = ctypes.windll.kernel32.GetUserDefaultUILanguage()
+                code = _WINDOWS_LANGUAGES.get(lang_id & 0x3FF)
+                if code:
+                    return code
+            except Exception:
+                pass
         return 'ru'  # Русский по умолчанию
     
     def _load_translations(self) -> None:
-        """Загружает переводы из файлов локализации"""
-        # Директория с файлами локализации
-        locales_dir = os.path.join(
-            os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
-            'resources', 'locales'
-        )
+        """Загружает переводы: встроенные сразу, из файлов локализации по требованию"""
+        # Встроенные переводы загружаются вместе с байт-кодом модуля, без разбора JSON
+        self.translations = dict(BUNDLED_TRANSLATIONS)
         
-        # Создаем директорию, если она не существует
-        if not os.path.exists(locales_dir):
-            os.makedirs(locales_dir, exist_ok=True)
+        # Запоминаем языки, для которых есть только файлы локализации;
+        # сами файлы читаются при первом обращении
+        self._available = set()
+        try:
+            with os.scandir(_LOCALES_DIR) as entries:
+                for entry in entries:
+                    if entry.name.endswith('.json') and entry.is_file():
+                        self._available.add(entry.name[:-5])
+        except OSError:
+            # Директории локализации может не быть: достаточно встроенных переводов
+            pass
+        self._available -= self.translations.keys()
         
-        # Загружаем переводы для всех доступных языков
-        for lang_file in os.listdir(locales_dir) if os.path.exists(locales_dir) else []:
-            if lang_file.endswith('.json'):
-                lang_code = os.path.splitext(lang_file)[0]
+        # Язык системы может отсутствовать среди встроенных
+        self._load_lang(self.current_lang)
+    
+    def _load_lang(self, lang_code: str) -> bool:
+        """Загружает переводы для языка, если они еще не загружены
+        
+        Returns:
+            True, если переводы для языка доступны
+        """
+        if lang_code in self.translations:
+            return True
+        if lang_code not in self._available:
+            return False
+        
+        try:
+            self.translations[lang_code] = _read_locale(lang_code)
+            return True
+        except Exception as e:
+            print(f"Ошибка загрузки локализации {lang_code}.json: {e}")
+            self._available.discard(lang_code)
+            return False
+    
+    def preload_languages(self, lang_codes: Optional[Iterable[str]] = None) -> List[str]:
+        """Загружает переводы для нескольких языков сразу
+        
+        Файлы локализации читаются параллельно в пуле потоков, так что время
+        загрузки определяется самым медленным файлом, а не их суммой.
+        
+        Args:
+            lang_codes: Коды языков. Если None, загружаются все доступные языки
+        
+        Returns:
+            Список кодов языков, переводы которых загружены
+        """
+        lang_codes = self.get_available_languages() if lang_codes is None else list(lang_codes)
+        pending = [code for code in lang_codes if code in self._available and code not in self.translations]
+        
+        if len(pending) > 1:
+            def read(lang_code):
                 try:
-                    with open(os.path.join(locales_dir, lang_file), 'r', encoding='utf-8') as f:
-                        self.translations[lang_code] = json.load(f)
+                    return _read_locale(lang_code), None
                 except Exception as e:
-                    print(f"Ошибка загрузки локализации {lang_file}: {e}")
+                    return None, e
+            
+            with ThreadPoolExecutor(max_workers=min(_MAX_LOAD_WORKERS, len(pending))) as executor:
+                for lang_code, (texts, error) in zip(pending, executor.map(read, pending)):
+                    if error is None:
+                        self.translations[lang_code] = texts
+                    else:
+                        print(f"Ошибка загрузки локализации {lang_code}.json: {error}")
+                        self._available.discard(lang_code)
+        else:
+            for lang_code in pending:
+                self._load_lang(lang_code)
         
-        # Если нет файлов локализации или текущий язык не найден, создаем базовые переводы
-        if not self.translations or self.current_lang not in self.translations:
-            self._create_default_translations()
+        return [code for code in lang_codes if code in self.translations]
     
-    def _create_default_translations(self) -> None:
-        """Создает файлы с базовыми переводами"""
-        locales_dir = os.path.join(
-            os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
-            'resources', 'locales'
-        )
+    def export_translations(self) -> None:
+        """Сохраняет загруженные переводы в файлы локализации
         
+        Файлы записываются в компактном виде; для читаемого форматирования
+        установите переменную окружения KSP_PRETTY_LOCALES=1
+        """
         # Создаем директорию, если она не существует
-        if not os.path.exists(locales_dir):
-            os.makedirs(locales_dir, exist_ok=True)
-        
-        # Базовые переводы для русского языка
-        ru_translations = {
-            "app_title": "KSP Video Downloader",
-            "url_label": "URL видео:",
-            "format_label": "Формат:",
-            "save_path_label": "Путь сохранения:",
-            "browse_button": "Обзор",
-            "download_button": "Загрузить",
-            "cancel_button": "Отмена",
-            "status_ready": "Готов к загрузке",
-            "status_downloading": "Загрузка: {progress}% - {speed} - Осталось: {eta}",
-            "status_complete": "Загрузка завершена: {filename}",
-            "status_error": "Ошибка: {error}",
-            "format_best": "Лучшее качество",
-            "format_720p": "720p",
-            "format_1080p": "1080p",
-            "format_480p": "480p",
-            "format_360p": "360p",
-            "format_mp3": "MP3 (только аудио)",
-            "error_invalid_url": "Неверный URL видео",
-            "error_network": "Ошибка сети",
-            "error_permission": "Ошибка доступа к файлу",
-            "dialog_title_browse": "Выберите директорию для сохранения",
-            "dialog_title_error": "Ошибка",
-            "dialog_title_info": "Информация",
-            "dialog_msg_complete": "Загрузка завершена успешно!",
-            "language_changed": "Язык изменен. Приложение будет перезапущено для применения изменений.",
-            "language_change_error": "Ошибка при смене языка. Выбранный язык недоступен.",
-            "general_tab": "Общие",
-            "kinescope_tab": "Kinescope",
-            "language_label": "Язык:",
-            "manual_input": "Ручной ввод",
-            "file_input": "Загрузка из файла",
-            "drag_drop_hint": "Перетащите JSON файл сюда или нажмите кнопку выбора",
-            "select_file_button": "Выбрать файл",
-            "referrer_label": "Referrer:",
-            "video_url_label": "URL видео:",
-            "filename_label": "Имя файла:",
-            "codec_label": "Кодек:",
-            "codec_help": "Справка по кодекам"
-        }
-        
-        # Базовые переводы для английского языка
-        en_translations = {
-            "app_title": "KSP Video Downloader",
-            "url_label": "Video URL:",
-            "format_label": "Format:",
-            "save_path_label": "Save path:",
-            "browse_button": "Browse",
-            "download_button": "Download",
-            "cancel_button": "Cancel",
-            "status_ready": "Ready to download",
-            "status_downloading": "Downloading: {progress}% - {speed} - ETA: {eta}",
-            "status_complete": "Download complete: {filename}",
-            "status_error": "Error: {error}",
-            "format_best": "Best quality",
-            "format_720p": "720p",
-            "format_1080p": "1080p",
-            "format_480p": "480p",
-            "format_360p": "360p",
-            "format_mp3": "MP3 (audio only)",
-            "error_invalid_url": "Invalid video URL",
-            "error_network": "Network error",
-            "error_permission": "File access error",
-            "dialog_title_browse": "Select save directory",
-            "dialog_title_error": "Error",
-            "dialog_title_info": "Information",
-            "dialog_msg_complete": "Download completed successfully!",
-            "language_changed": "Language changed. The application will restart to apply changes.",
-            "language_change_error": "Error changing language. Selected language is not available.",
-            "general_tab": "General",
-            "kinescope_tab": "Kinescope",
-            "language_label": "Language:",
-            "manual_input": "Manual input",
-            "file_input": "File upload",
-            "drag_drop_hint": "Drag and drop JSON file here or click select button",
-            "select_file_button": "Select file",
-            "referrer_label": "Referrer:",
-            "video_url_label": "Video URL:",
-            "filename_label": "Filename:",
-            "codec_label": "Codec:",
-            "codec_help": "Codec help"
-        }
-        
-        # Сохраняем переводы в файлы
-        self.translations['ru'] = ru_translations
-        self.translations['en'] = en_translations
+        os.makedirs(_LOCALES_DIR, exist_ok=True)
+        pretty = os.environ.get('KSP_PRETTY_LOCALES') == '1'
         
-        try:
-            with open(os.path.join(locales_dir, 'ru.json'), 'w', encoding='utf-8') as f:
-                json.dump(ru_translations, f, ensure_ascii=False, indent=2)
-            
-            with open(os.path.join(locales_dir, 'en.json'), 'w', encoding='utf-8') as f:
-                json.dump(en_translations, f, ensure_ascii=False, indent=2)
-        except Exception as e:
-            print(f"Ошибка создания файлов локализации: {e}")
+        for lang_code, translations in self.translations.items():
+            try:
+                with open(os.path.join(_LOCALES_DIR, f"{lang_code}.json"), 'wb') as f:
+                    f.write(_dumps(translations, pretty))
+            except Exception as e:
+                print(f"Ошибка создания файла локализации {lang_code}.json: {e}")
     
     def set_language(self, lang: str) -> bool:
         """Устанавливает текущий язык. Возвращает True при успешной установке, иначе False"""
-        if lang in self.translations and self.current_lang != lang:
+        if self.current_lang != lang and self._load_lang(lang):
             self.current_lang = lang
+            self._update_active()
             return True
         return False
     
+    def _update_active(self) -> None:
+        """Обновляет словари переводов текущего и запасного (английского) языков"""
+        self._active = self.translations.get(self.current_lang, {})
+        self._fallback = self.translations.get('en', {})
+    
+    def _get_template(self, lang: str, key: str, text: str) -> Optional[Callable[[Dict[str, Any]], str]]:
+        """Возвращает скомпилированный шаблон строки (кэшируется для пары язык/ключ)
+        
+        Returns:
+            Функция, подставляющая параметры в строку,
+            или None, если шаблон нужно форматировать через str.format
+        """
+        cache_key = (lang, key)
+        try:
+            return self._templates[cache_key]
+        except KeyError:
+            pass
+        
+        template = _compile_template(text)
+        self._templates[cache_key] = template
+        return template
+    
     def get_text(self, key: str, **kwargs: Any) -> str:
         """Возвращает локализованный текст по ключу
         
@@ -204,45 +297,34 @@ class Localization:
             Локализованный текст
         """
         # Получаем текст из текущего языка или из английского, если ключ не найден
-        text = self.translations.get(self.current_lang, {}).get(key)
+        text = self._active.get(key)
         if text is None:
-            text = self.translations.get('en', {}).get(key, key)
+            text = self._fallback.get(key, key)
+        if not kwargs:
+            return text
         
-        # Форматируем строку, если есть параметры
-        if kwargs and isinstance(text, str):
-            try:
+        # Форматируем строку по заранее скомпилированному шаблону
+        try:
+            template = self._get_template(self.current_lang, key, text)
+            if template is None:
                 return text.format(**kwargs)
-            except KeyError as e:
-                print(f"Ошибка форматирования строки {key}: {e}")
-                return text
-        
-        return text
-
-
-# Глобальный экземпляр для использования во всем приложении
-_localization = None
+            return template(kwargs)
+        except KeyError as e:
+            print(f"Ошибка форматирования строки {key}: {e}")
+            return text
 
 
+@functools.lru_cache(maxsize=1)
 def get_localization() -> Localization:
     """Возвращает глобальный экземпляр локализации
     
     Returns:
         Экземпляр класса Localization
     """
-    global _localization
-    if _localization is None:
-        _localization = Localization()
-    return _localization
+    return Localization()
 
 
-def _(key: str, **kwargs: Any) -> str:
-    """Функция-помощник для получения локализованного текста
-    
-    Args:
-        key: Ключ текста в файле локализации
-        **kwargs: Параметры для форматирования строки
-    
-    Returns:
-        Локализованный текст
-    """
-    return get_localization().get_text(key, **kwargs)
\ No newline at end of file
+# Функция-помощник для получения локализованного текста: _(key, **kwargs).
+# Связана напрямую с методом глобального экземпляра, без промежуточного вызова;
+# set_language меняет язык этого же экземпляра, поэтому привязка остается верной
+_ = get_localization().get_text
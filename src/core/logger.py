@@ -3,11 +3,19 @@
 
 import os
 import sys
+import queue
+import atexit
 import logging
+import functools
 from datetime import datetime
-from logging.handlers import RotatingFileHandler
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
 
 
+# Дата для имени файла лога (имя файла определяется с точностью до дня)
+LOG_DATE = datetime.now().strftime('%Y%m%d')
+
+
+@functools.lru_cache(maxsize=1)
 def get_executable_dir():
     """Получает директорию исполняемого файла или скрипта"""
     if getattr(sys, 'frozen', False):
@@ -18,9 +26,20 @@ def get_executable_dir():
         return os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 
+def file_logging_enabled():
+    """Проверяет, нужно ли писать лог в файл
+    
+    Запись в файл отключается переменной окружения KSP_NO_FILE_LOG=1
+    (ее устанавливают тесты)
+    """
+    return os.environ.get('KSP_NO_FILE_LOG') != '1'
+
+
 class Logger:
     """Класс для настройки логирования в приложении"""
     
+    __slots__ = ('logger', '_listener')
+    
     def __init__(self, name="ksp_video_downloader", level=logging.INFO):
         """Инициализация логгера
         
@@ -30,44 +49,59 @@ class Logger:
         """
         self.logger = logging.getLogger(name)
         self.logger.setLevel(level)
+        self._listener = None
         
         # Если обработчики уже добавлены, не добавляем новые
         if self.logger.handlers:
             return
         
-        # Создаем директорию для логов в папке с исполняемым файлом
-        logs_dir = os.path.join(get_executable_dir(), 'logs')
-        if not os.path.exists(logs_dir):
-            os.makedirs(logs_dir, exist_ok=True)
-        
         # Формат логов
         formatter = logging.Formatter(
             '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
             datefmt='%Y-%m-%d %H:%M:%S'
         )
         
-        # Обработчик для вывода в файл с ротацией
-        log_file = os.path.join(
-            logs_dir,
-            f"{name}_{datetime.now().strftime('%Y%m%d')}.log"
-        )
-        file_handler = RotatingFileHandler(
-            log_file,
-            maxBytes=10 * 1024 * 1024,  # 10 МБ
-            backupCount=5,
-            encoding='utf-8'
-        )
-        file_handler.setLevel(level)
-        file_handler.setFormatter(formatter)
+        handlers = []
+        if file_logging_enabled():
+            # Создаем директорию для логов в папке с исполняемым файлом
+            logs_dir = os.path.join(get_executable_dir(), 'logs')
+            os.makedirs(logs_dir, exist_ok=True)
+            
+            # Обработчик для вывода в файл с ротацией; файл открывается
+            # при первой записи в лог (delay=True)
+            log_file = os.path.join(logs_dir, f"{name}_{LOG_DATE}.log")
+            file_handler = RotatingFileHandler(
+                log_file,
+                maxBytes=10 * 1024 * 1024,  # 10 МБ
+                backupCount=5,
+                encoding='utf-8',
+                delay=True
+            )
+            file_handler.setLevel(level)
+            file_handler.setFormatter(formatter)
+            handlers.append(file_handler)
         
-        # Обработчик для вывода в консоль
-        console_handler = logging.StreamHandler()
-        console_handler.setLevel(level)
-        console_handler.setFormatter(formatter)
+        # Обработчик для вывода в консоль; в собранном приложении без консоли
+        # (pythonw) потоков вывода нет, и запись в них только тратит время на исключения
+        stream = sys.stderr
+        if stream is not None and stream.isatty():
+            console_handler = logging.StreamHandler(stream)
+            console_handler.setLevel(level)
+            console_handler.setFormatter(formatter)
+            handlers.append(console_handler)
         
-        # Добавляем обработчики к логгеру
-        self.logger.addHandler(file_handler)
-        self.logger.addHandler(console_handler)
+        # Запись в файл и консоль выполняется в отдельном потоке: логгер только
+        # кладет записи в очередь и не блокирует поток интерфейса на вводе-выводе
+        if handlers:
+            log_queue = queue.SimpleQueue()
+            self.logger.addHandler(QueueHandler(log_queue))
+            self._listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+            self._listener.start()
+            # При завершении приложения дописываем оставшиеся в очереди записи
+            atexit.register(self._listener.stop)
+        
+        # Записи не передаются корневому логгеру, чтобы не обрабатываться дважды
+        self.logger.propagate = False
     
     def get_logger(self):
         """Возвращает настроенный логгер
@@ -78,13 +112,12 @@ class Logger:
         return self.logger
 
 
-# Глобальный экземпляр логгера для использования во всем приложении
-_logger = None
-
-
+@functools.lru_cache(maxsize=None)
 def get_logger(name="ksp_video_downloader", level=logging.INFO):
     """Возвращает глобальный экземпляр логгера
     
+    Логгер создается один раз для каждой пары (имя, уровень)
+    
     Args:
         name: Имя логгера
         level: Уровень логирования
@@ -92,7 +125,4 @@ def get_logger(name="ksp_video_downloader", level=logging.INFO):
     Returns:
         Экземпляр логгера
     """
-    global _logger
-    if _logger is None:
-        _logger = Logger(name, level).get_logger()
-    return _logger
\ No newline at end of file
+    return Logger(name, level).get_logger()
@@ -3,14 +3,8 @@
 
 import sys
 import os
-import logging
-from PySide6.QtWidgets import QApplication
-from PySide6.QtCore import QDir
+from logging import INFO
 
-# Добавляем корневую директорию проекта в sys.path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-from src.ui.main_window import MainWindow
 from src.core.logger import get_logger
 from src.core.localization import get_localization, _
 
@@ -26,7 +20,7 @@ def setup_environment():
     os.chdir(app_dir)
     
     # Инициализация логгера
-    logger = get_logger(level=logging.INFO)
+    logger = get_logger(level=INFO)
     logger.info("Приложение запущено")
     
     # Инициализация локализации
@@ -38,6 +32,10 @@ def main():
     setup_environment()
     logger = get_logger()
     
+    # Qt и главное окно импортируются после подготовки окружения
+    from PySide6.QtWidgets import QApplication
+    from src.ui.main_window import MainWindow
+    
     try:
         app = QApplication(sys.argv)
         app.setApplicationName(_("app_title"))
@@ -3,45 +3,187 @@
 
 import os
 import logging
-import sys
+import threading
 
 from PySide6.QtWidgets import (
-    QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
+    QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QFormLayout,
     QLabel, QLineEdit, QPushButton, QComboBox, 
     QProgressBar, QFileDialog, QMessageBox, QStatusBar,
     QTabWidget, QRadioButton, QButtonGroup, QFrame, QApplication, QSizePolicy
 )
-from PySide6.QtCore import Qt, QSize, Signal, Slot, QThread, QMimeData, QProcess, QPropertyAnimation, QEasingCurve, QRect, Property
+from PySide6.QtCore import Qt, QSize, Signal, Slot, QObject, QRunnable, QThreadPool, QMimeData, QPropertyAnimation, QEasingCurve, QRect, QEvent, Property
 from PySide6.QtGui import QIcon, QPixmap, QDragEnterEvent, QDropEvent, QPainter, QColor, QPen
 
 import json
-import os
 
-# Код для перезапуска приложения
-RESTART_CODE = 1000
+# Корневая директория проекта
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Директория для загрузок по умолчанию
+DEFAULT_DOWNLOADS = os.path.join(PROJECT_ROOT, "downloads")
+
+# Иконка приложения
+ICON_PATH = os.path.join(PROJECT_ROOT, "resources", "icon.ico")
+
+# Стили приложения: устанавливаются один раз на QApplication, виджеты выбираются
+# по objectName, так что Qt разбирает QSS один раз вместо вызова на каждый виджет
+APP_STYLESHEET = """
+    QLabel#appTitle {
+        font-size: 24px;
+        font-weight: bold;
+        margin-bottom: 10px;
+    }
+    QPushButton#primaryDownload {
+        font-size: 14px;
+        font-weight: bold;
+        padding: 10px 20px;
+        background-color: #007acc;
+        color: white;
+        border: none;
+        border-radius: 6px;
+    }
+    QPushButton#primaryDownload:hover {
+        background-color: #005a9e;
+    }
+    QPushButton#primaryDownload:pressed {
+        background-color: #004578;
+    }
+    QPushButton#primaryDownload:disabled {
+        background-color: #cccccc;
+        color: #666666;
+    }
+    QFrame#dropArea {
+        border: 2px dashed #aaa;
+        border-radius: 8px;
+        background-color: #f9f9f9;
+    }
+    QFrame#dropArea:hover {
+        border-color: #007acc;
+        background-color: #f0f8ff;
+    }
+    QLabel#dropHint {
+        color: #666;
+        font-size: 12px;
+        font-weight: 500;
+    }
+"""
+
+# Расширения файлов, принимаемых перетаскиванием на вкладку Kinescope
+JSON_EXTENSIONS = ('.json',)
+
+# Варианты формата загрузки: (ключ подписи, значение формата)
+FORMAT_OPTIONS = (
+    ("format_best", "best"),
+    ("format_1080p", "1080"),
+    ("format_720p", "720"),
+    ("format_480p", "480"),
+    ("format_mp3", "mp3"),
+)
+
+# Варианты кодека видео на вкладке "Общие": (подпись, значение кодека)
+CODEC_OPTIONS = (
+    ("H.264 (совместимость)", "h264"),
+    ("AV1 (лучшее качество)", "av1"),
+)
+
+# Строки форм вкладок: (ключ подписи, атрибут окна, класс поля, подсказка в поле)
+GENERAL_FORM_ROWS = (
+    ("url_label", "url_input", QLineEdit, "Вставьте URL видео для загрузки"),
+    ("format_label", "format_combo", QComboBox, None),
+    ("codec_label", "codec_combo", QComboBox, None),
+    ("save_path_label", "save_path_input", QLineEdit, None),
+)
+KINESCOPE_FORM_ROWS = (
+    ("referrer_label", "referrer_input", QLineEdit, "https://..."),
+    ("video_url_label", "kinescope_url_input", QLineEdit, "https://kinescope.io/... или прямая ссылка на .m3u8"),
+    ("filename_label", "filename_input", QLineEdit, "video_name"),
+    ("codec_label", "kinescope_codec_combo", QComboBox, None),
+    ("save_path_label", "kinescope_save_path_input", QLineEdit, None),
+)
 
-from src.core.downloader import VideoDownloader
 from src.core.logger import get_logger
 from src.core.localization import get_localization, _
+from src.core.kinescope import read_kinescope_json
+
+
+def populate_combo(combo, items):
+    """Заполняет комбобокс одной вставкой строк вместо добавления по одному элементу
+    
+    Args:
+        combo: Комбобокс
+        items: Последовательность пар (подпись, данные элемента)
+    """
+    start = combo.count()
+    combo.blockSignals(True)
+    combo.addItems([text for text, _data in items])
+    for index, (_text, data) in enumerate(items, start):
+        combo.setItemData(index, data)
+    combo.blockSignals(False)
 
 
-class DownloadWorker(QThread):
-    """Рабочий поток для загрузки видео"""
+class JsonParseSignals(QObject):
+    """Сигналы задачи разбора JSON файла"""
+    parsed = Signal(str, object, object)
+    failed = Signal(str, str)
+
+
+class JsonParseTask(QRunnable):
+    """Задача пула потоков для разбора JSON файла Kinescope"""
+    
+    def __init__(self, file_path):
+        super().__init__()
+        self.file_path = file_path
+        self.signals = JsonParseSignals()
+        self.logger = get_logger()
+    
+    def run(self):
+        try:
+            referrer, shakahls = read_kinescope_json(self.file_path)
+            self.signals.parsed.emit(self.file_path, referrer, shakahls)
+        except json.JSONDecodeError:
+            self.logger.error(f"Ошибка декодирования JSON файла: {self.file_path}", exc_info=True)
+            self.signals.failed.emit(self.file_path, "❌ Ошибка: неверный формат JSON")
+        except Exception as e:
+            self.logger.error(f"Неизвестная ошибка при обработке JSON файла: {self.file_path}: {e}", exc_info=True)
+            self.signals.failed.emit(self.file_path, f"❌ Ошибка: {str(e)}")
+
+
+class DownloadSignals(QObject):
+    """Сигналы задачи загрузки видео"""
     progress_updated = Signal(float, str)
     download_finished = Signal(bool, str)
     error = Signal(str)
+    cancelled = Signal()
+
+
+class DownloadWorker(QRunnable):
+    """Задача пула потоков для загрузки видео
+    
+    Сигналы испускаются из потока пула и доставляются в поток интерфейса
+    через очередь событий Qt.
+    """
     
-    def __init__(self, url, output_path, format_option, codec="h264", referrer=None):
+    def __init__(self, downloader, url, output_path, format_option, codec="h264", referrer=None):
         super().__init__()
+        # Общий загрузчик окна: его экземпляры YoutubeDL переиспользуются между загрузками
+        self.downloader = downloader
         self.url = url
         self.output_path = output_path
         self.format_option = format_option
         self.codec = codec
         self.referrer = referrer
-        self.downloader = VideoDownloader()
+        self.signals = DownloadSignals()
+        # Флаг отмены: поток пула нельзя прервать, загрузка останавливается сама
+        self._cancel = threading.Event()
         self.logger = get_logger()
     
+    def cancel(self):
+        """Запрашивает отмену загрузки"""
+        self._cancel.set()
+    
     def run(self):
+        from src.core.downloader import DownloadCancelled
+        
         try:
             self.logger.info(f"Начало загрузки видео: {self.url}")
             self.logger.info(f"Формат: {self.format_option}, кодек: {self.codec}, путь сохранения: {self.output_path}")
@@ -50,16 +192,20 @@ class DownloadWorker(QThread):
                 self.url, 
                 self.output_path, 
                 self.format_option,
-                progress_callback=self.progress_updated.emit,
+                progress_callback=self.signals.progress_updated.emit,
                 codec=self.codec,
-                referrer=self.referrer
+                referrer=self.referrer,
+                cancel_event=self._cancel
             )
             
             self.logger.info(f"Загрузка завершена успешно: {result_file}")
-            self.download_finished.emit(True, _("status_complete").format(filename=os.path.basename(result_file)))
+            self.signals.download_finished.emit(True, _("status_complete", filename=os.path.basename(result_file)))
+        except DownloadCancelled:
+            self.logger.info(f"Загрузка отменена: {self.url}")
+            self.signals.cancelled.emit()
         except Exception as e:
             self.logger.error(f"Ошибка загрузки: {str(e)}", exc_info=True)
-            self.error.emit(_("status_error").format(error=str(e)))
+            self.signals.error.emit(_("status_error", error=str(e)))
 
 
 class MainWindow(QMainWindow):
@@ -78,13 +224,32 @@ class MainWindow(QMainWindow):
         self.setMinimumSize(QSize(600, 460))  # Увеличена высота на 15% (400 -> 460)
         self.resize(1000, 700)
         
-        # Загружаем иконку
-        icon_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "resources", "icon.ico")
-        if os.path.exists(icon_path):
-            self.setWindowIcon(QIcon(icon_path))
+        # Общие стили устанавливаются до создания виджетов
+        QApplication.instance().setStyleSheet(APP_STYLESHEET)
         
+        # Загружаем иконку
+        if os.path.exists(ICON_PATH):
+            self.setWindowIcon(QIcon(ICON_PATH))
+        
+        # Виджеты с локализованным текстом: (виджет, ключ, метод установки текста)
+        self._translatable = []
+        
+        # Задача загрузки выполняется в общем пуле потоков
+        self.download_worker = None
+        self._download_active = False
+        # Загрузчик создается при первой загрузке и используется всеми последующими
+        self._downloader = None
+        # Окно закрывается после остановки отмененной загрузки
+        self._close_requested = False
+        # Последние показанные процент и статус загрузки
+        self._last_pct = None
+        self._last_status = None
+        
+        # Отрисовка откладывается до завершения построения интерфейса
+        self.setUpdatesEnabled(False)
         self.setup_ui()
         self.setup_connections()
+        self.setUpdatesEnabled(True)
         self.logger.info("Главное окно успешно инициализировано")
     
     def setup_ui(self):
@@ -102,9 +267,9 @@ class MainWindow(QMainWindow):
         header_layout = QHBoxLayout()
         
         # Заголовок приложения
-        title_label = QLabel(_("app_title"))
+        title_label = self._register_text(QLabel(), "app_title")
         title_label.setAlignment(Qt.AlignCenter)
-        title_label.setStyleSheet("font-size: 24px; font-weight: bold; margin-bottom: 10px;")
+        title_label.setObjectName("appTitle")
         header_layout.addWidget(title_label, 1)
         
         # Переключатель языка
@@ -132,16 +297,18 @@ class MainWindow(QMainWindow):
         self.setup_general_tab()
         self.tab_widget.addTab(self.general_tab, _("general_tab"))
         
-        # Вкладка "Kinescope"
+        # Вкладка "Kinescope" заполняется виджетами при первом переходе на нее
         self.kinescope_tab = QWidget()
-        self.setup_kinescope_tab()
+        self._kinescope_built = False
         self.tab_widget.addTab(self.kinescope_tab, _("kinescope_tab"))
+        self.tab_widget.currentChanged.connect(self._ensure_kinescope_tab)
         
         main_layout.addWidget(self.tab_widget)
         
         # Прогресс загрузки
+        status_ready = _("status_ready")
         progress_layout = QVBoxLayout()
-        self.progress_label = QLabel(_("status_ready"))
+        self.progress_label = QLabel(status_ready)
         self.progress_bar = QProgressBar()
         self.progress_bar.setRange(0, 100)
         self.progress_bar.setValue(0)
@@ -155,12 +322,11 @@ class MainWindow(QMainWindow):
         # Статусная строка
         self.statusBar = QStatusBar()
         self.setStatusBar(self.statusBar)
-        self.statusBar.showMessage(_("status_ready"))
+        self.statusBar.showMessage(status_ready)
         
         # Установка пути сохранения по умолчанию
-        default_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "downloads")
-        self.save_path_input.setText(default_path)
-        self.logger.info(f"Установлен путь сохранения по умолчанию: {default_path}")
+        self.save_path_input.setText(DEFAULT_DOWNLOADS)
+        self.logger.info(f"Установлен путь сохранения по умолчанию: {DEFAULT_DOWNLOADS}")
         
     def setup_general_tab(self):
         """Настройка вкладки 'Общие'"""
@@ -168,105 +334,47 @@ class MainWindow(QMainWindow):
         layout.setSpacing(12)  # Унифицированный интервал
         layout.setContentsMargins(15, 15, 15, 15)  # Унифицированные отступы
         
-        # URL видео - унифицированная высота
-        url_layout = QHBoxLayout()
-        url_label = QLabel(_("url_label"))
-        url_label.setFixedWidth(120)  # Фиксированная ширина лейбла
-        url_label.setFixedHeight(30)  # Фиксированная высота лейбла
-        self.url_input = QLineEdit()
-        self.url_input.setPlaceholderText("Вставьте URL видео для загрузки")
-        self.url_input.setFixedHeight(30)  # Фиксированная высота поля ввода
-        url_layout.addWidget(url_label)
-        url_layout.addWidget(self.url_input)
-        layout.addLayout(url_layout)
-        
-        # Выбор формата - унифицированная высота
-        format_layout = QHBoxLayout()
-        format_label = QLabel(_("format_label"))
-        format_label.setFixedWidth(120)  # Фиксированная ширина лейбла
-        format_label.setFixedHeight(30)  # Фиксированная высота лейбла
-        self.format_combo = QComboBox()
-        self.format_combo.addItem(_("format_best"), "best")
-        self.format_combo.addItem(_("format_1080p"), "1080")
-        self.format_combo.addItem(_("format_720p"), "720")
-        self.format_combo.addItem(_("format_480p"), "480")
-        self.format_combo.addItem(_("format_mp3"), "mp3")
-        self.format_combo.addItem("Только аудио (M4A)", "m4a")
-        self.format_combo.setFixedHeight(30)  # Фиксированная высота комбобокса
-        format_layout.addWidget(format_label)
-        format_layout.addWidget(self.format_combo)
-        layout.addLayout(format_layout)
-        
-        # Выбор кодека (AV1/H.264) - унифицированная высота
-        codec_layout = QHBoxLayout()
-        codec_label = QLabel("Кодек видео:")
-        codec_label.setFixedWidth(120)  # Фиксированная ширина лейбла
-        codec_label.setFixedHeight(30)  # Фиксированная высота лейбла
-        self.codec_combo = QComboBox()
-        self.codec_combo.addItem("H.264 (совместимость)", "h264")
-        self.codec_combo.addItem("AV1 (лучшее качество)", "av1")
-        self.codec_combo.setFixedHeight(30)  # Фиксированная высота комбобокса
+        # Строки формы: URL, формат, кодек и путь сохранения
+        rows = self._build_form(layout, GENERAL_FORM_ROWS)
+        
+        populate_combo(
+            self.format_combo,
+            [(_(key), format_option) for key, format_option in FORMAT_OPTIONS]
+            + [("Только аудио (M4A)", "m4a")]
+        )
+        populate_combo(self.codec_combo, CODEC_OPTIONS)
         
         # Добавляем кнопку с вопросительным знаком для подсказки
         self.codec_help_button = QPushButton("?")
         self.codec_help_button.setFixedSize(30, 30)  # Унифицированный размер кнопки помощи
         self.codec_help_button.setToolTip("H.264: Лучшая совместимость с устройствами\nAV1: Лучшее качество при меньшем размере файла, но может не поддерживаться старыми устройствами")
         self.codec_help_button.clicked.connect(self.show_codec_help)
+        rows["codec_combo"].addWidget(self.codec_help_button)
         
-        codec_layout.addWidget(codec_label)
-        codec_layout.addWidget(self.codec_combo)
-        codec_layout.addWidget(self.codec_help_button)
-        layout.addLayout(codec_layout)
-        
-        # Выбор директории для сохранения - унифицированная высота
-        save_layout = QHBoxLayout()
-        save_label = QLabel(_("save_path_label"))
-        save_label.setFixedWidth(120)  # Фиксированная ширина лейбла
-        save_label.setFixedHeight(30)  # Фиксированная высота лейбла
-        self.save_path_input = QLineEdit()
+        # Выбор директории для сохранения
         self.save_path_input.setReadOnly(True)
-        self.save_path_input.setFixedHeight(30)  # Фиксированная высота поля ввода
-        self.browse_button = QPushButton(_("browse_button"))
+        self.browse_button = self._register_text(QPushButton(), "browse_button")
         self.browse_button.setFixedHeight(30)  # Фиксированная высота кнопки
         self.browse_button.setFixedWidth(100)  # Фиксированная ширина кнопки
-        save_layout.addWidget(save_label)
-        save_layout.addWidget(self.save_path_input)
-        save_layout.addWidget(self.browse_button)
-        layout.addLayout(save_layout)
+        rows["save_path_input"].addWidget(self.browse_button)
         
         # Добавляем растягивающийся пробел для выравнивания кнопки загрузки внизу
         layout.addStretch()
         
         # Кнопка загрузки - унифицированный стиль и позиционирование
-        download_layout = QHBoxLayout()
-        download_layout.addStretch()
-        self.download_button = QPushButton(_("download_button"))
-        self.download_button.setStyleSheet("""
-            QPushButton {
-                font-size: 14px; 
-                font-weight: bold;
-                padding: 10px 20px; 
-                background-color: #007acc;
-                color: white;
-                border: none;
-                border-radius: 6px;
-            }
-            QPushButton:hover {
-                background-color: #005a9e;
-            }
-            QPushButton:pressed {
-                background-color: #004578;
-            }
-            QPushButton:disabled {
-                background-color: #cccccc;
-                color: #666666;
-            }
-        """)
-        self.download_button.setFixedHeight(40)  # Фиксированная высота кнопки
-        self.download_button.setFixedWidth(160)  # Фиксированная ширина кнопки
-        download_layout.addWidget(self.download_button)
-        download_layout.addStretch()
-        layout.addLayout(download_layout)
+        self.download_button = self._add_download_button(layout)
+        
+    @Slot(int)
+    def _ensure_kinescope_tab(self, index):
+        """Создает содержимое вкладки Kinescope при первом переходе на нее"""
+        if self._kinescope_built or self.tab_widget.widget(index) is not self.kinescope_tab:
+            return
+        
+        self.kinescope_tab.setUpdatesEnabled(False)
+        self.setup_kinescope_tab()
+        self.setup_kinescope_connections()
+        self._kinescope_built = True
+        self.kinescope_tab.setUpdatesEnabled(True)
         
     def setup_kinescope_tab(self):
         """Настройка вкладки 'Kinescope'"""
@@ -281,23 +389,13 @@ class MainWindow(QMainWindow):
         self.drop_area.setFixedHeight(80)  # Уменьшенная высота для предотвращения наложений
         self.drop_area.setAcceptDrops(True)
         self.drop_area.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
-        self.drop_area.setStyleSheet("""
-            QFrame {
-                border: 2px dashed #aaa;
-                border-radius: 8px;
-                background-color: #f9f9f9;
-            }
-            QFrame:hover {
-                border-color: #007acc;
-                background-color: #f0f8ff;
-            }
-        """)
+        self.drop_area.setObjectName("dropArea")
         
         drop_layout = QVBoxLayout(self.drop_area)
         drop_layout.setContentsMargins(10, 10, 10, 10)
-        self.drop_label = QLabel(_("drag_drop_hint"))
+        self.drop_label = self._register_text(QLabel(), "drag_drop_hint")
         self.drop_label.setAlignment(Qt.AlignCenter)
-        self.drop_label.setStyleSheet("color: #666; font-size: 12px; font-weight: 500;")
+        self.drop_label.setObjectName("dropHint")
         self.drop_label.setFixedHeight(20)  # Уменьшенная высота для лейбла
         drop_layout.addWidget(self.drop_label)
         
@@ -318,113 +416,146 @@ class MainWindow(QMainWindow):
         separator.setFixedHeight(2)  # Фиксированная высота
         layout.addWidget(separator)
         
-        # Referrer - точно такие же настройки как в General
-        referrer_layout = QHBoxLayout()
-        referrer_label = QLabel(_("referrer_label"))
-        referrer_label.setFixedWidth(120)  # Фиксированная ширина лейбла - как в General
-        referrer_label.setFixedHeight(30)  # Фиксированная высота лейбла - как в General
-        self.referrer_input = QLineEdit()
-        self.referrer_input.setPlaceholderText("https://...")
-        self.referrer_input.setFixedHeight(30)  # Фиксированная высота поля ввода - как в General
-        referrer_layout.addWidget(referrer_label)
-        referrer_layout.addWidget(self.referrer_input)
-        layout.addLayout(referrer_layout)
-        
-        # URL видео - точно такие же настройки как в General
-        video_url_layout = QHBoxLayout()
-        video_url_label = QLabel(_("video_url_label"))
-        video_url_label.setFixedWidth(120)  # Фиксированная ширина лейбла - как в General
-        video_url_label.setFixedHeight(30)  # Фиксированная высота лейбла - как в General
-        self.kinescope_url_input = QLineEdit()
-        self.kinescope_url_input.setPlaceholderText("https://kinescope.io/... или прямая ссылка на .m3u8")
-        self.kinescope_url_input.setFixedHeight(30)  # Фиксированная высота поля ввода - как в General
-        video_url_layout.addWidget(video_url_label)
-        video_url_layout.addWidget(self.kinescope_url_input)
-        layout.addLayout(video_url_layout)
-        
-        # Имя файла - точно такие же настройки как в General
-        filename_layout = QHBoxLayout()
-        filename_label = QLabel(_("filename_label"))
-        filename_label.setFixedWidth(120)  # Фиксированная ширина лейбла - как в General
-        filename_label.setFixedHeight(30)  # Фиксированная высота лейбла - как в General
-        self.filename_input = QLineEdit()
-        self.filename_input.setPlaceholderText("video_name")
-        self.filename_input.setFixedHeight(30)  # Фиксированная высота поля ввода - как в General
-        filename_layout.addWidget(filename_label)
-        filename_layout.addWidget(self.filename_input)
-        layout.addLayout(filename_layout)
+        # Строки формы: referrer, URL видео, имя файла, кодек и путь сохранения
+        rows = self._build_form(layout, KINESCOPE_FORM_ROWS)
         
         # Кодек с помощью - точно такие же настройки как в General
-        codec_layout = QHBoxLayout()
-        codec_label = QLabel(_("codec_label"))
-        codec_label.setFixedWidth(120)  # Фиксированная ширина лейбла - как в General
-        codec_label.setFixedHeight(30)  # Фиксированная высота лейбла - как в General
-        self.kinescope_codec_combo = QComboBox()
         self.kinescope_codec_combo.addItems(["h264", "h265"])
         self.kinescope_codec_combo.setCurrentText("h264")
-        self.kinescope_codec_combo.setFixedHeight(30)  # Фиксированная высота комбобокса - как в General
         self.kinescope_codec_help_button = QPushButton("?")
         self.kinescope_codec_help_button.setFixedSize(30, 30)  # Унифицированный размер кнопки помощи - как в General
-        self.kinescope_codec_help_button.setToolTip(_("codec_help"))
-        codec_layout.addWidget(codec_label)
-        codec_layout.addWidget(self.kinescope_codec_combo)
-        codec_layout.addWidget(self.kinescope_codec_help_button)
-        layout.addLayout(codec_layout)
+        self._register_text(self.kinescope_codec_help_button, "codec_help", "setToolTip")
+        rows["kinescope_codec_combo"].addWidget(self.kinescope_codec_help_button)
         
         # Выбор директории для сохранения - точно такие же настройки как в General
-        save_layout = QHBoxLayout()
-        save_label = QLabel(_("save_path_label"))
-        save_label.setFixedWidth(120)  # Фиксированная ширина лейбла - как в General
-        save_label.setFixedHeight(30)  # Фиксированная высота лейбла - как в General
-        self.kinescope_save_path_input = QLineEdit()
         self.kinescope_save_path_input.setReadOnly(True)
-        self.kinescope_save_path_input.setFixedHeight(30)  # Фиксированная высота поля ввода - как в General
         self.kinescope_save_path_input.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
-        self.kinescope_browse_button = QPushButton(_("browse_button"))
+        self.kinescope_browse_button = self._register_text(QPushButton(), "browse_button")
         self.kinescope_browse_button.setFixedHeight(30)  # Фиксированная высота кнопки - как в General
         self.kinescope_browse_button.setFixedWidth(100)  # Фиксированная ширина кнопки - как в General
-        save_layout.addWidget(save_label)
-        save_layout.addWidget(self.kinescope_save_path_input)
-        save_layout.addWidget(self.kinescope_browse_button)
-        layout.addLayout(save_layout)
+        rows["kinescope_save_path_input"].addWidget(self.kinescope_browse_button)
         
         # Добавляем растягивающийся пробел для выравнивания кнопки загрузки внизу - как в General
         layout.addStretch()
         
         # Кнопка загрузки - унифицированный стиль и позиционирование - точно как в General
+        self.kinescope_download_button = self._add_download_button(layout)
+        
+        # Устанавливаем путь сохранения по умолчанию
+        self.kinescope_save_path_input.setText(DEFAULT_DOWNLOADS)
+    
+    def _register_text(self, widget, key, setter="setText"):
+        """Устанавливает локализованный текст виджета и запоминает его для смены языка
+        
+        Args:
+            widget: Виджет
+            key: Ключ текста в файле локализации
+            setter: Имя метода виджета, устанавливающего текст
+        
+        Returns:
+            Тот же виджет
+        """
+        getattr(widget, setter)(_(key))
+        self._translatable.append((widget, key, setter))
+        return widget
+    
+    def retranslate_ui(self, previous_status=None):
+        """Обновляет тексты интерфейса после смены языка
+        
+        Args:
+            previous_status: Текст статуса готовности на прежнем языке; статус
+                обновляется, только если с момента запуска он не менялся
+        """
+        for widget, key, setter in self._translatable:
+            getattr(widget, setter)(_(key))
+        
+        self.setWindowTitle(_("app_title"))
+        self.tab_widget.setTabText(self.tab_widget.indexOf(self.general_tab), _("general_tab"))
+        self.tab_widget.setTabText(self.tab_widget.indexOf(self.kinescope_tab), _("kinescope_tab"))
+        for index, (key, _format_option) in enumerate(FORMAT_OPTIONS):
+            self.format_combo.setItemText(index, _(key))
+        
+        status_ready = _("status_ready")
+        if self.progress_label.text() == previous_status:
+            self.progress_label.setText(status_ready)
+        if self.statusBar.currentMessage() == previous_status:
+            self.statusBar.showMessage(status_ready)
+    
+    def apply_language(self, lang_code):
+        """Переключает язык интерфейса без перезапуска приложения
+        
+        Returns:
+            True при успешной смене языка, иначе False
+        """
+        previous_status = _("status_ready")
+        if not get_localization().set_language(lang_code):
+            return False
+        # Загрузчик кэширует локализованные единицы измерения
+        if self._downloader is not None:
+            self._downloader.refresh_locale()
+        self.retranslate_ui(previous_status)
+        return True
+    
+    def _add_download_button(self, parent_layout):
+        """Добавляет кнопку загрузки по центру макета вкладки
+        
+        Стиль кнопки задается правилом QPushButton#primaryDownload в APP_STYLESHEET
+        
+        Returns:
+            Созданная кнопка
+        """
         download_layout = QHBoxLayout()
         download_layout.addStretch()
-        self.kinescope_download_button = QPushButton(_("download_button"))
-        self.kinescope_download_button.setStyleSheet("""
-            QPushButton {
-                font-size: 14px; 
-                font-weight: bold;
-                padding: 10px 20px; 
-                background-color: #007acc;
-                color: white;
-                border: none;
-                border-radius: 6px;
-            }
-            QPushButton:hover {
-                background-color: #005a9e;
-            }
-            QPushButton:pressed {
-                background-color: #004578;
-            }
-            QPushButton:disabled {
-                background-color: #cccccc;
-                color: #666666;
-            }
-        """)
-        self.kinescope_download_button.setFixedHeight(40)  # Фиксированная высота кнопки - как в General
-        self.kinescope_download_button.setFixedWidth(160)  # Фиксированная ширина кнопки - как в General
-        download_layout.addWidget(self.kinescope_download_button)
+        button = self._register_text(QPushButton(), "download_button")
+        button.setObjectName("primaryDownload")
+        button.setFixedHeight(40)  # Фиксированная высота кнопки
+        button.setFixedWidth(160)  # Фиксированная ширина кнопки
+        download_layout.addWidget(button)
         download_layout.addStretch()
-        layout.addLayout(download_layout)
+        parent_layout.addLayout(download_layout)
+        return button
+    
+    def _build_form_row(self, form, label_key, attr, factory, placeholder=None):
+        """Добавляет в форму строку с подписью и полем ввода
         
-        # Устанавливаем путь сохранения по умолчанию
-        default_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "downloads")
-        self.kinescope_save_path_input.setText(default_path)
+        Поле сохраняется в атрибут окна с именем attr
+        
+        Returns:
+            Макет поля, в который можно добавить дополнительные кнопки
+        """
+        widget = factory()
+        if placeholder:
+            widget.setPlaceholderText(placeholder)
+        widget.setFixedHeight(30)  # Фиксированная высота поля ввода
+        setattr(self, attr, widget)
+        
+        field_layout = QHBoxLayout()
+        field_layout.addWidget(widget)
+        form.addRow(self._register_text(QLabel(), label_key), field_layout)
+        return field_layout
+    
+    def _build_form(self, parent_layout, rows):
+        """Создает форму по таблице описаний строк
+        
+        Подписи выравниваются самим QFormLayout, без фиксированных размеров
+        
+        Returns:
+            Словарь: имя атрибута поля -> макет его строки
+        """
+        form = QFormLayout()
+        form.setLabelAlignment(Qt.AlignLeft | Qt.AlignVCenter)
+        form.setFieldGrowthPolicy(QFormLayout.ExpandingFieldsGrow)
+        form.setVerticalSpacing(parent_layout.spacing())
+        
+        # Пересчет макета откладывается до добавления всех строк
+        form.setEnabled(False)
+        row_layouts = {
+            attr: self._build_form_row(form, label_key, attr, factory, placeholder)
+            for label_key, attr, factory, placeholder in rows
+        }
+        form.setEnabled(True)
+        parent_layout.addLayout(form)
+        return row_layouts
     
     def setup_connections(self):
         """Настройка сигналов и слотов"""
@@ -435,11 +566,11 @@ class MainWindow(QMainWindow):
         # Переключатель языка
         self.lang_toggle.language_changed.connect(self.change_language_from_toggle)
         
-        # Kinescope вкладка
+    def setup_kinescope_connections(self):
+        """Настройка сигналов и слотов вкладки Kinescope"""
         self.kinescope_browse_button.clicked.connect(self.browse_kinescope_save_path)
         self.kinescope_download_button.clicked.connect(self.start_kinescope_download)
         # self.select_json_button.clicked.connect(self.select_json_file)  # удалено
-        self.codec_help_button.clicked.connect(self.show_codec_help)
         self.kinescope_codec_help_button.clicked.connect(self.show_codec_help)
         
         # Настройка обработки перетаскивания для drop_area
@@ -466,74 +597,9 @@ class MainWindow(QMainWindow):
             self.kinescope_save_path_input.setText(directory)
             self.logger.info(f"Выбрана директория для сохранения Kinescope: {directory}")
     
-    def show_codec_help(self):
-        """Показывает информационное сообщение о кодеках"""
-        QMessageBox.information(
-            self, 
-            "Информация о кодеках", 
-            """H.264 (AVC):
-• Широко поддерживается всеми устройствами
-• Хорошее соотношение качества и размера файла
-• Рекомендуется для максимальной совместимости
-
-AV1:
-• Новый кодек с лучшим сжатием
-• Лучшее качество при меньшем размере файла
-• Может не поддерживаться старыми устройствами
-• Рекомендуется для новых устройств и экономии места"""
-        )
-        
-    def change_language(self, index):
-        lang_code = self.lang_combo.itemData(index)
-        if lang_code:
-            self.logger.info(f"Попытка смены языка на: {lang_code}")
-            localization = get_localization()
-            if localization.set_language(lang_code):
-                self.logger.info(f"Язык успешно изменен на: {lang_code}")
-                QMessageBox.information(
-                    self,
-                    _("dialog_title_info"),
-                    _("language_changed"),
-                )
-                # Правильный перезапуск приложения
-                self.logger.info("Перезапуск приложения для применения нового языка")
-                QApplication.instance().quit()
-                # Получаем путь к main.py в корне проекта
-                import __main__
-                if hasattr(__main__, '__file__'):
-                    main_script = os.path.abspath(__main__.__file__)
-                else:
-                    # Fallback для случаев, когда __main__.__file__ недоступен
-                    main_script = os.path.abspath(sys.argv[0])
-                QProcess.startDetached(sys.executable, [main_script])
-            else:
-                self.logger.error(f"Ошибка при смене языка на: {lang_code}")
-                QMessageBox.critical(
-                    self,
-                    _("dialog_title_error"),
-                    _("language_change_error"),
-                )
-
     def change_language_from_toggle(self, lang_code):
         """Обработка смены языка от toggle switch"""
-        localization = get_localization()
-        if localization.set_language(lang_code):
-            QMessageBox.information(
-                self,
-                _("dialog_title_info"),
-                _("language_changed"),
-            )
-            # Правильный перезапуск приложения
-            QApplication.instance().quit()
-            # Получаем путь к main.py в корне проекта
-            import __main__
-            if hasattr(__main__, '__file__'):
-                main_script = os.path.abspath(__main__.__file__)
-            else:
-                # Fallback для случаев, когда __main__.__file__ недоступен
-                main_script = os.path.abspath(sys.argv[0])
-            QProcess.startDetached(sys.executable, [main_script])
-        else:
+        if not self.apply_language(lang_code):
             QMessageBox.critical(
                 self,
                 _("dialog_title_error"),
@@ -599,8 +665,7 @@ AV1:
     
     def select_json_file(self):
         """Выбор JSON файла для Kinescope"""
-        from core.localization import _
-        file_path, _ = QFileDialog.getOpenFileName(
+        file_path, _filter = QFileDialog.getOpenFileName(
             self, 
             _("dialog_title_browse"), 
             "", 
@@ -609,111 +674,97 @@ AV1:
         if file_path:
             self.process_json_file(file_path)
             
+    def _dropped_json_path(self, event):
+        """Возвращает путь к JSON файлу, если перетаскивается ровно один такой файл
+        
+        Список URL запрашивается у Qt один раз на событие
+        
+        Returns:
+            Локальный путь к файлу или None
+        """
+        if self.tab_widget.currentWidget() is not self.kinescope_tab:
+            return None
+        mime_data = event.mimeData()
+        if not mime_data.hasUrls():
+            return None
+        urls = mime_data.urls()
+        if len(urls) != 1 or not urls[0].isLocalFile():
+            return None
+        file_path = urls[0].toLocalFile()
+        return file_path if file_path.endswith(JSON_EXTENSIONS) else None
+    
     def dragEnterEvent(self, event: QDragEnterEvent):
         """Обработка события перетаскивания файла"""
-        if self.tab_widget.currentWidget() == self.kinescope_tab:
-            mime_data = event.mimeData()
-            if mime_data.hasUrls() and len(mime_data.urls()) == 1:
-                url = mime_data.urls()[0]
-                if url.isLocalFile() and url.toLocalFile().endswith('.json'):
-                    event.acceptProposedAction()
+        if self._dropped_json_path(event):
+            event.acceptProposedAction()
                     
     def dropEvent(self, event: QDropEvent):
         """Обработка события сброса файла"""
-        if self.tab_widget.currentWidget() == self.kinescope_tab:
-            mime_data = event.mimeData()
-            if mime_data.hasUrls() and len(mime_data.urls()) == 1:
-                url = mime_data.urls()[0]
-                if url.isLocalFile() and url.toLocalFile().endswith('.json'):
-                    file_path = url.toLocalFile()
-                    self.process_json_file(file_path)
-                    event.acceptProposedAction()
+        file_path = self._dropped_json_path(event)
+        if file_path:
+            self.process_json_file(file_path)
+            event.acceptProposedAction()
                     
     def process_json_file(self, file_path):
-        """Обработка JSON файла для Kinescope с визуальной анимацией загрузки"""
-        try:
-            # Показываем анимацию загрузки
-            self.json_info_label.setText("🔄 Обработка файла...")
-            self.json_info_label.setStyleSheet("color: #ff9500; font-weight: bold; margin: 5px 0;")
-            
-            # Обрабатываем файл через небольшую задержку для показа анимации
-            QApplication.processEvents()
-            
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                
-            # Извлекаем необходимые данные из JSON
-            referrer = None
-            shakahls = None
-            
-            # Поиск referrer и shakahls в JSON структуре
-            if isinstance(data, dict):
-                # Поиск referrer в корне JSON (строка 8)
-                if 'referrer' in data:
-                    referrer = data['referrer']
-                
-                # Рекурсивный поиск shakahls и m3u8 URL
-                def find_m3u8_url(obj, path=""):
-                    if isinstance(obj, dict):
-                        for k, v in obj.items():
-                            # Приоритет для shakahls
-                            if k == 'shakahls' and isinstance(v, str):
-                                return v
-                            elif isinstance(v, str) and '.m3u8' in v:
-                                return v
-                            elif isinstance(v, (dict, list)):
-                                result = find_m3u8_url(v, f"{path}.{k}")
-                                if result:
-                                    return result
-                    elif isinstance(obj, list):
-                        for i, item in enumerate(obj):
-                            if isinstance(item, str) and '.m3u8' in item:
-                                return item
-                            elif isinstance(item, (dict, list)):
-                                result = find_m3u8_url(item, f"{path}[{i}]")
-                                if result:
-                                    return result
-                    return None
-                
-                shakahls = find_m3u8_url(data)
-                
-                # Обрезаем URL до .m3u8 включительно
-                if shakahls and '.m3u8' in shakahls:
-                    m3u8_index = shakahls.find('.m3u8')
-                    if m3u8_index != -1:
-                        shakahls = shakahls[:m3u8_index + 5]  # +5 для включения ".m3u8"
-            
-            if not shakahls:
-                self.json_info_label.setText("❌ Не найден URL видео (.m3u8)")
-                self.json_info_label.setStyleSheet("color: #ff4444; font-weight: bold; margin: 5px 0;")
-                self.logger.warning(f"В JSON файле '{file_path}' не найден shakahls/m3u8 URL.")
-                return
-            
-            # Автозаполнение полей
-            if referrer:
-                self.referrer_input.setText(referrer)
-            
-            if shakahls:
-                self.kinescope_url_input.setText(shakahls)
-            
-            # Попытка извлечь имя файла из URL или использовать имя JSON файла
-            filename = os.path.splitext(os.path.basename(file_path))[0]
-            if not self.filename_input.text():
-                self.filename_input.setText(filename)
-            
-            # Показываем успешное завершение
-            self.json_info_label.setText(f"✅ Файл загружен: {os.path.basename(file_path)}")
-            self.json_info_label.setStyleSheet("color: #007acc; font-weight: bold; margin: 5px 0;")
-            self.logger.info(f"JSON файл '{file_path}' успешно загружен и обработан.")
-            
-        except json.JSONDecodeError:
-            self.json_info_label.setText("❌ Ошибка: неверный формат JSON")
-            self.json_info_label.setStyleSheet("color: #ff4444; font-weight: bold; margin: 5px 0;")
-            self.logger.error(f"Ошибка декодирования JSON файла: {file_path}", exc_info=True)
-        except Exception as e:
-            self.json_info_label.setText(f"❌ Ошибка: {str(e)}")
+        """Обработка JSON файла для Kinescope с визуальной анимацией загрузки
+        
+        Файл разбирается в пуле потоков, результат приходит в _on_json_parsed
+        или _on_json_failed
+        """
+        # Показываем анимацию загрузки
+        self.json_info_label.setText("🔄 Обработка файла...")
+        self.json_info_label.setStyleSheet("color: #ff9500; font-weight: bold; margin: 5px 0;")
+        
+        # Результаты разбора ранее выбранных файлов игнорируются
+        self._json_path = file_path
+        
+        # Ссылка на задачу хранит объект сигналов до получения результата
+        self._json_task = JsonParseTask(file_path)
+        self._json_task.signals.parsed.connect(self._on_json_parsed)
+        self._json_task.signals.failed.connect(self._on_json_failed)
+        QThreadPool.globalInstance().start(self._json_task)
+    
+    @Slot(str, object, object)
+    def _on_json_parsed(self, file_path, referrer, shakahls):
+        """Заполняет поля вкладки Kinescope данными из разобранного JSON файла"""
+        if file_path != self._json_path:
+            return
+        
+        # Обрезаем URL до .m3u8 включительно
+        if shakahls:
+            head, m3u8, _tail = shakahls.partition('.m3u8')
+            if m3u8:
+                shakahls = head + m3u8
+        
+        if not shakahls:
+            self.json_info_label.setText("❌ Не найден URL видео (.m3u8)")
             self.json_info_label.setStyleSheet("color: #ff4444; font-weight: bold; margin: 5px 0;")
-            self.logger.error(f"Неизвестная ошибка при обработке JSON файла: {file_path}: {e}", exc_info=True)
+            self.logger.warning(f"В JSON файле '{file_path}' не найден shakahls/m3u8 URL.")
+            return
+        
+        # Автозаполнение полей
+        if referrer:
+            self.referrer_input.setText(referrer)
+        
+        self.kinescope_url_input.setText(shakahls)
+        
+        # Попытка извлечь имя файла из URL или использовать имя JSON файла
+        filename = os.path.splitext(os.path.basename(file_path))[0]
+        if not self.filename_input.text():
+            self.filename_input.setText(filename)
+        
+        # Показываем успешное завершение
+        self.json_info_label.setText(f"✅ Файл загружен: {os.path.basename(file_path)}")
+        self.json_info_label.setStyleSheet("color: #007acc; font-weight: bold; margin: 5px 0;")
+        self.logger.info(f"JSON файл '{file_path}' успешно загружен и обработан.")
+    
+    @Slot(str, str)
+    def _on_json_failed(self, file_path, message):
+        """Показывает ошибку разбора JSON файла"""
+        if file_path != self._json_path:
+            return
+        self.json_info_label.setText(message)
+        self.json_info_label.setStyleSheet("color: #ff4444; font-weight: bold; margin: 5px 0;")
             
     def start_download(self):
         """Запускает процесс загрузки видео"""
@@ -735,11 +786,8 @@ AV1:
         self.progress_bar.setValue(0)
         self.set_ui_enabled(False)
         
-        self.download_worker = DownloadWorker(url, output_path, format_option, codec)
-        self.download_worker.progress_updated.connect(self.update_progress)
-        self.download_worker.download_finished.connect(self.download_finished)
-        self.download_worker.error.connect(self.download_error)
-        self.download_worker.start()
+        self.download_worker = DownloadWorker(self._get_downloader(), url, output_path, format_option, codec)
+        self._start_worker()
         
     def start_kinescope_download(self):
         """Запускает процесс загрузки видео с Kinescope"""
@@ -781,28 +829,59 @@ AV1:
         
         # Запускаем загрузку
         self.download_worker = DownloadWorker(
+            self._get_downloader(),
             video_url, 
             full_output_path, 
             "best", 
             codec, 
             referrer=referrer if referrer else None
         )
-        self.download_worker.progress_updated.connect(self.update_progress)
-        self.download_worker.download_finished.connect(self.download_finished)
-        self.download_worker.error.connect(self.download_error)
-        self.download_worker.start()
+        self._start_worker()
+            
+    def _get_downloader(self):
+        """Возвращает общий загрузчик, создавая его при первом обращении
+        
+        Загрузки выполняются по одной (интерфейс блокируется на время загрузки),
+        поэтому один загрузчик и его экземпляры YoutubeDL не используются
+        из нескольких потоков одновременно
+        """
+        if self._downloader is None:
+            from src.core.downloader import VideoDownloader
+            self._downloader = VideoDownloader()
+        return self._downloader
+    
+    def _start_worker(self):
+        """Запускает подготовленную задачу загрузки в общем пуле потоков"""
+        signals = self.download_worker.signals
+        signals.progress_updated.connect(self.update_progress)
+        signals.download_finished.connect(self.download_finished)
+        signals.error.connect(self.download_error)
+        signals.cancelled.connect(self.download_cancelled)
+        self._download_active = True
+        self._last_pct = 0
+        self._last_status = None
+        QThreadPool.globalInstance().start(self.download_worker)
             
     @Slot(float, str)
     def update_progress(self, progress, status_message):
-        """Обновляет прогресс бар и статус загрузки"""
-        self.progress_bar.setValue(int(progress))
-        self.progress_label.setText(status_message)
-        self.statusBar.showMessage(status_message)
+        """Обновляет прогресс бар и статус загрузки
+        
+        Повторные значения пропускаются, чтобы не перерисовывать виджеты впустую
+        """
+        percent = int(progress)
+        if percent != self._last_pct:
+            self._last_pct = percent
+            self.progress_bar.setValue(percent)
+        if status_message != self._last_status:
+            self._last_status = status_message
+            self.progress_label.setText(status_message)
+            self.statusBar.showMessage(status_message)
         
     @Slot(bool, str)
     def download_finished(self, success, message):
         """Обрабатывает завершение загрузки"""
-        self.set_ui_enabled(True)
+        if self._download_stopped():
+            return
         self.progress_label.setText(message)
         self.statusBar.showMessage(message)
         if success:
@@ -816,29 +895,52 @@ AV1:
     def download_error(self, message):
         """Обрабатывает ошибки загрузки"""
         self.logger.error(f"Ошибка во время загрузки: {message}")
-        self.set_ui_enabled(True)
+        if self._download_stopped():
+            return
         self.progress_label.setText(message)
         self.statusBar.showMessage(message)
         QMessageBox.critical(self, _("dialog_title_error"), message)
         
+    @Slot()
+    def download_cancelled(self):
+        """Обрабатывает остановку отмененной загрузки"""
+        if self._download_stopped():
+            return
+        self.progress_label.setText(_("status_ready"))
+        self.statusBar.showMessage(_("status_ready"))
+    
+    def _download_stopped(self):
+        """Снимает признак активной загрузки и закрывает окно, если закрытие ждало ее остановки
+        
+        Returns:
+            True, если окно закрывается
+        """
+        self._download_active = False
+        if self._close_requested:
+            self.close()
+            return True
+        self.set_ui_enabled(True)
+        return False
+    
     def set_ui_enabled(self, enabled):
-        """Включает/отключает элементы UI во время загрузки"""
-        self.url_input.setEnabled(enabled)
-        self.format_combo.setEnabled(enabled)
-        self.codec_combo.setEnabled(enabled)
-        self.browse_button.setEnabled(enabled)
-        self.download_button.setEnabled(enabled)
-        
-        self.kinescope_url_input.setEnabled(enabled)
-        self.referrer_input.setEnabled(enabled)
-        self.kinescope_browse_button.setEnabled(enabled)
-        self.kinescope_download_button.setEnabled(enabled)
-        self.kinescope_codec_combo.setEnabled(enabled)
-        self.tab_widget.setEnabled(enabled)
+        """Включает/отключает элементы UI во время загрузки
+        
+        Поля и кнопки обеих вкладок наследуют состояние от tab_widget,
+        поэтому переключается только он, а перерисовка выполняется один раз
+        """
+        self.setUpdatesEnabled(False)
+        try:
+            self.tab_widget.setEnabled(enabled)
+        finally:
+            self.setUpdatesEnabled(True)
         
     def closeEvent(self, event):
         """Обработка закрытия окна"""
-        if hasattr(self, 'download_worker') and self.download_worker.isRunning():
+        if self._download_active:
+            # Загрузка уже отменяется: окно закроется, когда она остановится
+            if self._close_requested:
+                event.ignore()
+                return
             reply = QMessageBox.question(
                 self, 
                 _("dialog_title_warning"), 
@@ -847,13 +949,32 @@ AV1:
                 QMessageBox.No
             )
             if reply == QMessageBox.Yes:
-                self.download_worker.terminate()
-                self.download_worker.wait()
-                event.accept()
+                # Поток пула нельзя завершить принудительно: отменяем загрузку,
+                # она остановится на ближайшей проверке отмены (событие прогресса
+                # или шаг постобработки)
+                self._close_requested = True
+                self.download_worker.cancel()
+                if QThreadPool.globalInstance().waitForDone(2000):
+                    self._close_downloader()
+                    event.accept()
+                else:
+                    # Загрузка не успела остановиться (например, идет извлечение
+                    # информации или работа ffmpeg): окно остается открытым и
+                    # закрывается по сигналу о ее завершении
+                    self.progress_label.setText(_("status_cancelling"))
+                    self.statusBar.showMessage(_("status_cancelling"))
+                    event.ignore()
             else:
                 event.ignore()
         else:
+            self._close_downloader()
             event.accept()
+    
+    def _close_downloader(self):
+        """Закрывает общий загрузчик и его экземпляры YoutubeDL"""
+        if self._downloader is not None:
+            self._downloader.close()
+            self._downloader = None
 
 
 class LanguageToggle(QWidget):
@@ -866,6 +987,9 @@ class LanguageToggle(QWidget):
         # Уменьшаем переключатель в 4 раза
         self.setFixedSize(30, 10)
         self.current_lang = "ru"  # По умолчанию русский
+        # Закэшированные слои отрисовки: фон и подписи для каждого языка
+        self._background = None
+        self._labels = {}
         self.animation = QPropertyAnimation(self, b"slider_position")
         self.animation.setDuration(150)
         self.animation.setEasingCurve(QEasingCurve.OutCubic)
@@ -881,6 +1005,10 @@ class LanguageToggle(QWidget):
     
     def set_language(self, lang):
         """Установить текущий язык"""
+        # Переключатель знает только русский и английский; для остальных языков
+        # интерфейс показывает английские переводы
+        if lang not in ("ru", "en"):
+            lang = "en"
         if lang != self.current_lang:
             self.current_lang = lang
             # В уменьшенной версии половина ширины зоны слайдера ~15
@@ -889,38 +1017,73 @@ class LanguageToggle(QWidget):
             self.animation.setEndValue(target_pos)
             self.animation.start()
     
-    def paintEvent(self, event):
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
+    def _new_layer(self, dpr):
+        """Создает прозрачный QPixmap размером с переключатель"""
+        pixmap = QPixmap(self.size() * dpr)
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.transparent)
+        return pixmap
+    
+    def _build_layers(self):
+        """Растеризует статичные части переключателя
+        
+        Фон не зависит от состояния, подписи рисуются отдельно для каждого
+        языка: во время анимации меняется только положение активной области
+        """
+        dpr = self.devicePixelRatioF()
         
         # Фон переключателя
-        bg_color = QColor(240, 240, 240)
-        painter.setBrush(bg_color)
+        background = self._new_layer(dpr)
+        painter = QPainter(background)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setBrush(QColor(240, 240, 240))
         painter.setPen(QPen(QColor(200, 200, 200), 1))
         painter.drawRoundedRect(0, 0, self.width(), self.height(), 5, 5)
+        painter.end()
+        
+        # Текст поверх активной области; выбранный язык подписывается белым
+        labels = {}
+        for lang in ("ru", "en"):
+            pixmap = self._new_layer(dpr)
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.Antialiasing)
+            font = self.font()
+            font.setPointSize(6)
+            font.setBold(True)
+            painter.setFont(font)
+            
+            painter.setPen(QColor(255, 255, 255) if lang == "ru" else QColor(100, 100, 100))
+            painter.drawText(QRect(1, 0, 12, 10), Qt.AlignCenter, "RU")
+            painter.setPen(QColor(255, 255, 255) if lang == "en" else QColor(100, 100, 100))
+            painter.drawText(QRect(17, 0, 12, 10), Qt.AlignCenter, "EN")
+            painter.end()
+            labels[lang] = pixmap
+        
+        self._background = background
+        self._labels = labels
+    
+    def changeEvent(self, event):
+        # Смена стиля или шрифта требует перерисовать закэшированные слои
+        if event.type() in (QEvent.StyleChange, QEvent.FontChange):
+            self._background = None
+        super().changeEvent(event)
+    
+    def paintEvent(self, event):
+        # Слои строятся заново при первой отрисовке и после переноса окна
+        # на экран с другим масштабом
+        if self._background is None or self._background.devicePixelRatio() != self.devicePixelRatioF():
+            self._build_layers()
+        
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.drawPixmap(0, 0, self._background)
         
         # Активная область
-        active_color = QColor(70, 130, 180)
-        painter.setBrush(active_color)
+        painter.setBrush(QColor(70, 130, 180))
         painter.setPen(Qt.NoPen)
         painter.drawRoundedRect(self._slider_position, 1, 14, 8, 4, 4)
         
-        # Текст
-        painter.setPen(QColor(100, 100, 100))
-        font = painter.font()
-        font.setPointSize(6)
-        font.setBold(True)
-        painter.setFont(font)
-        
-        # Русский текст
-        ru_color = QColor(255, 255, 255) if self.current_lang == "ru" else QColor(100, 100, 100)
-        painter.setPen(ru_color)
-        painter.drawText(QRect(1, 0, 12, 10), Qt.AlignCenter, "RU")
-        
-        # Английский текст
-        en_color = QColor(255, 255, 255) if self.current_lang == "en" else QColor(100, 100, 100)
-        painter.setPen(en_color)
-        painter.drawText(QRect(17, 0, 12, 10), Qt.AlignCenter, "EN")
+        painter.drawPixmap(0, 0, self._labels[self.current_lang])
     
     def mousePressEvent(self, event):
         if event.button() == Qt.LeftButton:
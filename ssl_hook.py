@@ -7,17 +7,25 @@ Runtime hook для исправления проблем с SSL библиот
 
 import os
 import sys
-import importlib.util
-import importlib.machinery
-import ctypes
-from pathlib import Path
+import logging
+
+
+# Флаги LoadLibraryExW: поиск зависимостей в каталогах, добавленных через
+# AddDllDirectory, и в System32 вместо полного обхода PATH
+LOAD_LIBRARY_SEARCH_USER_DIRS = 0x00000400
+LOAD_LIBRARY_SEARCH_SYSTEM32 = 0x00000800
 
 
 def fix_ssl_paths():
     """
     Исправляет пути к SSL библиотекам для корректной работы в упакованном приложении
     """
-    print("Применение SSL hook...")
+    # При запуске из исходников библиотеки SSL находятся штатно
+    if not getattr(sys, 'frozen', False):
+        return
+    
+    logger = logging.getLogger(__name__)
+    logger.debug("Применение SSL hook...")
     
     # Получаем базовый путь к приложению
     base_dir = getattr(sys, '_MEIPASS', os.path.dirname(os.path.abspath(__file__)))
@@ -30,21 +38,39 @@ def fix_ssl_paths():
     try:
         # Для Windows пытаемся загрузить DLL напрямую
         if sys.platform == 'win32':
-            # Ищем все DLL файлы в директории приложения
-            dll_dir = Path(base_dir)
-            ssl_dlls = list(dll_dir.glob("*ssl*.dll")) + list(dll_dir.glob("*crypto*.dll"))
+            import ctypes
+            
+            # Ищем DLL файлы SSL в директории приложения за один проход;
+            # имена сравниваются без учета регистра, как в файловой системе Windows
+            ssl_dlls = []
+            with os.scandir(base_dir) as entries:
+                for entry in entries:
+                    name = entry.name.lower()
+                    if name.endswith('.dll') and ('ssl' in name or 'crypto' in name) and entry.is_file():
+                        ssl_dlls.append(entry.path)
+            
+            kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+            kernel32.AddDllDirectory.argtypes = [ctypes.c_wchar_p]
+            kernel32.AddDllDirectory.restype = ctypes.c_void_p
+            kernel32.LoadLibraryExW.argtypes = [ctypes.c_wchar_p, ctypes.c_void_p, ctypes.c_uint32]
+            kernel32.LoadLibraryExW.restype = ctypes.c_void_p
+            kernel32.AddDllDirectory(base_dir)
+            flags = LOAD_LIBRARY_SEARCH_USER_DIRS | LOAD_LIBRARY_SEARCH_SYSTEM32
+            
+            # libssl зависит от libcrypto: загружаем libcrypto первой, чтобы
+            # при загрузке libssl зависимость уже была в памяти
+            ssl_dlls.sort(key=lambda path: 'crypto' not in os.path.basename(path).lower())
             
             for dll_path in ssl_dlls:
-                try:
-                    ctypes.CDLL(str(dll_path))
-                    print(f"Загружена библиотека: {dll_path}")
-                except Exception as e:
-                    print(f"Не удалось загрузить {dll_path}: {e}")
+                if kernel32.LoadLibraryExW(dll_path, None, flags):
+                    logger.debug("Загружена библиотека: %s", dll_path)
+                else:
+                    logger.debug("Не удалось загрузить %s: %s", dll_path, ctypes.WinError(ctypes.get_last_error()))
     
     except Exception as e:
-        print(f"Ошибка при загрузке SSL библиотек: {e}")
+        logger.debug("Ошибка при загрузке SSL библиотек: %s", e)
     
-    print("SSL hook применен")
+    logger.debug("SSL hook применен")
 
 
 # Применяем исправление при импорте этого модуля
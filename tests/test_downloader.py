@@ -2,6 +2,9 @@
 # -*- coding: utf-8 -*-
 
 import os
+import json
+import tempfile
+import threading
 import unittest
 from unittest.mock import MagicMock, patch
 import sys
@@ -9,7 +12,12 @@ import sys
 # Добавление родительской директории в путь для импорта модулей
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from src.core.downloader import VideoDownloader
+# Тесты не пишут лог в файл (переменная проверяется при создании логгера)
+os.environ.setdefault('KSP_NO_FILE_LOG', '1')
+
+from src.core.downloader import VideoDownloader, DownloadCancelled
+from src.core.localization import _compile_template
+from src.core import kinescope
 
 
 class TestVideoDownloader(unittest.TestCase):
@@ -33,6 +41,12 @@ class TestVideoDownloader(unittest.TestCase):
         self.assertEqual(self.downloader._format_size(1024 * 1024), "1.00 МБ")
         self.assertEqual(self.downloader._format_size(1024 * 1024 * 1024), "1.00 ГБ")
     
+    def test_format_size_overflow(self):
+        """Тест форматирования размера больше терабайта"""
+        self.assertEqual(self.downloader._format_size(1024 ** 5), "1.00 ПБ")
+        # Значения больше петабайта не переходят к следующей единице измерения
+        self.assertEqual(self.downloader._format_size(1024 ** 6), "1024.00 ПБ")
+    
     def test_format_time(self):
         """Тест форматирования времени"""
         self.assertEqual(self.downloader._format_time(30), "30 сек")
@@ -58,8 +72,7 @@ class TestVideoDownloader(unittest.TestCase):
     def test_download(self, mock_ytdl):
         """Тест загрузки видео"""
         # Настройка мока
-        mock_instance = MagicMock()
-        mock_ytdl.return_value.__enter__.return_value = mock_instance
+        mock_instance = mock_ytdl.return_value
         
         # Настройка возвращаемого значения extract_info
         mock_info = {"title": "Test Video", "ext": "mp4"}
@@ -76,6 +89,163 @@ class TestVideoDownloader(unittest.TestCase):
         self.assertTrue(os.path.exists(self.test_output_path))
         mock_instance.extract_info.assert_called_once_with(self.test_url, download=True)
         self.assertEqual(result, os.path.join(self.test_output_path, "Test Video.mp4"))
+    
+    @patch("yt_dlp.YoutubeDL")
+    def test_download_reuses_youtubedl(self, mock_ytdl):
+        """Тест повторного использования YoutubeDL для одинаковых настроек"""
+        mock_instance = mock_ytdl.return_value
+        mock_instance.extract_info.return_value = {"title": "Test Video", "ext": "mp4"}
+        mock_instance.prepare_filename.return_value = "Test Video.mp4"
+        
+        self.downloader.download(self.test_url, self.test_output_path, "best")
+        self.downloader.download(self.test_url, self.test_output_path, "best")
+        mock_ytdl.assert_called_once()
+        
+        self.downloader.download(self.test_url, self.test_output_path, "720")
+        self.assertEqual(mock_ytdl.call_count, 2)
+        
+        self.downloader.close()
+        self.assertEqual(mock_instance.close.call_count, 2)
+    
+    @patch("yt_dlp.YoutubeDL")
+    def test_download_cancel(self, mock_ytdl):
+        """Тест отмены загрузки через событие"""
+        cancel_event = threading.Event()
+        
+        def extract_info(url, download):
+            # Хук прогресса, зарегистрированный загрузчиком в опциях YoutubeDL
+            hook = mock_ytdl.call_args[0][0]['progress_hooks'][0]
+            cancel_event.set()
+            hook({"status": "downloading", "downloaded_bytes": 1, "filename": "Test Video.mp4"})
+        
+        mock_ytdl.return_value.extract_info.side_effect = extract_info
+        progress_callback = MagicMock()
+        
+        with self.assertRaises(DownloadCancelled):
+            self.downloader.download(
+                self.test_url, self.test_output_path, "best", progress_callback,
+                cancel_event=cancel_event
+            )
+        progress_callback.assert_not_called()
+    
+    @patch("yt_dlp.YoutubeDL")
+    def test_download_cancel_before_start(self, mock_ytdl):
+        """Тест отмены, запрошенной до начала загрузки"""
+        cancel_event = threading.Event()
+        cancel_event.set()
+        
+        with self.assertRaises(DownloadCancelled):
+            self.downloader.download(
+                self.test_url, self.test_output_path, "best", cancel_event=cancel_event
+            )
+        mock_ytdl.return_value.extract_info.assert_not_called()
+        # Отмена проверяется и хуком постобработки
+        self.assertEqual(mock_ytdl.call_args[0][0]['postprocessor_hooks'], [self.downloader._check_cancel])
+    
+    @patch("yt_dlp.YoutubeDL")
+    def test_download_many(self, mock_ytdl):
+        """Тест параллельной загрузки нескольких видео"""
+        mock_instance = mock_ytdl.return_value
+        mock_instance.extract_info.side_effect = lambda url, download: {"title": url[-1], "ext": "mp4"}
+        mock_instance.prepare_filename.side_effect = lambda info: f"{info['title']}.mp4"
+        
+        urls = [f"{self.test_url}{i}" for i in range(5)]
+        results = self.downloader.download_many(urls, self.test_output_path, "best", concurrency=3)
+        
+        self.assertEqual(results, [os.path.join(self.test_output_path, f"{i}.mp4") for i in range(5)])
+        self.assertEqual(mock_instance.extract_info.call_count, 5)
+    
+    @patch("yt_dlp.YoutubeDL")
+    def test_download_many_partial_failure(self, mock_ytdl):
+        """Тест пакетной загрузки с ошибкой одного видео и прогрессом по URL"""
+        failing_url = f"{self.test_url}1"
+        
+        def extract_info(url, download):
+            if url == failing_url:
+                raise Exception("network")
+            hook = mock_ytdl.call_args[0][0]['progress_hooks'][0]
+            hook({"status": "finished", "filename": f"{url[-1]}.mp4"})
+            return {"title": url[-1], "ext": "mp4"}
+        
+        mock_instance = mock_ytdl.return_value
+        mock_instance.extract_info.side_effect = extract_info
+        mock_instance.prepare_filename.side_effect = lambda info: f"{info['title']}.mp4"
+        progress_callback = MagicMock()
+        
+        urls = [f"{self.test_url}{i}" for i in range(3)]
+        results = self.downloader.download_many(
+            urls, self.test_output_path, "best", progress_callback, concurrency=1
+        )
+        
+        self.assertEqual(results[0], os.path.join(self.test_output_path, "0.mp4"))
+        self.assertIsInstance(results[1], Exception)
+        self.assertEqual(results[2], os.path.join(self.test_output_path, "2.mp4"))
+        self.assertEqual([c.args[0] for c in progress_callback.call_args_list], [urls[0], urls[2]])
+
+
+class TestLocalizationTemplates(unittest.TestCase):
+    """Тесты скомпилированных шаблонов локализации"""
+    
+    def assertMatchesFormat(self, text, **kwargs):
+        template = _compile_template(text)
+        self.assertIsNotNone(template)
+        self.assertEqual(template(kwargs), text.format(**kwargs))
+    
+    def test_percent_literal(self):
+        """Тест литерального знака процента в %-шаблоне"""
+        self.assertMatchesFormat("Загрузка: {progress}% - 100%s", progress="42.0")
+    
+    def test_escaped_braces(self):
+        """Тест экранированных фигурных скобок"""
+        self.assertMatchesFormat("{{literal}} {name} }}{{", name="value")
+    
+    def test_conversion(self):
+        """Тест преобразования значения !r"""
+        self.assertMatchesFormat("Ошибка: {error!r}, {count!s}", error="a 'b'", count=3)
+    
+    def test_format_spec(self):
+        """Тест спецификации формата поля"""
+        self.assertMatchesFormat("{percent:.1f}% {name!r:>12} {count:03d}", percent=42.456, name="x", count=7)
+    
+    def test_positional_fields_not_compiled(self):
+        """Тест шаблонов, которые форматирует str.format"""
+        self.assertIsNone(_compile_template("{0} {}"))
+        self.assertIsNone(_compile_template("{user.name}"))
+
+
+class TestKinescopeJson(unittest.TestCase):
+    """Тесты разбора JSON файлов Kinescope"""
+    
+    def setUp(self):
+        data = {
+            "referrer": "https://example.com/page",
+            "x": "https://cdn.example.com/a.m3u8",
+            "y": {"shakahls": "https://cdn.example.com/b.m3u8"},
+        }
+        fd, self.file_path = tempfile.mkstemp(suffix=".json")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+    
+    def tearDown(self):
+        os.remove(self.file_path)
+    
+    def test_fallback_prefers_nested_shakahls(self):
+        """Тест выбора shakahls при полном разборе файла"""
+        with patch.object(kinescope, "ijson", None):
+            result = kinescope.read_kinescope_json(self.file_path)
+        self.assertEqual(result, ("https://example.com/page", "https://cdn.example.com/b.m3u8"))
+    
+    @unittest.skipIf(kinescope.ijson is None, "ijson не установлен")
+    def test_stream_matches_fallback(self):
+        """Тест совпадения результатов потокового и полного разбора"""
+        with patch.object(kinescope, "ijson", None):
+            expected = kinescope.read_kinescope_json(self.file_path)
+        self.assertEqual(kinescope.read_kinescope_json(self.file_path), expected)
+    
+    def test_find_m3u8_url_without_shakahls(self):
+        """Тест выбора первой строки с .m3u8 в порядке следования"""
+        data = {"a": {"b": ["x", "first.m3u8"]}, "c": "second.m3u8"}
+        self.assertEqual(kinescope.find_m3u8_url(data), "first.m3u8")
 
 
 if __name__ == "__main__":